@@ -1,16 +1,48 @@
 """Base module with shared LLM configuration."""
 
 import os
+from functools import lru_cache
 
 from langchain_openai import ChatOpenAI
 from think_only_once.config.settings import get_settings
 
 
+@lru_cache(maxsize=4)
+def _build_llm(model: str, temperature: float, base_url: str | None, api_key: str, max_tokens: int) -> ChatOpenAI:
+    """Construct (or reuse) a ChatOpenAI client for the given configuration.
+
+    ChatOpenAI construction runs pydantic validation and builds an httpx
+    client; every agent factory calls get_llm(), so caching on the resolved
+    configuration means one client per config and lets all agents share its
+    connection pool. A config change yields a new key and a fresh client.
+
+    Args:
+        model: Model name.
+        temperature: Sampling temperature.
+        base_url: Optional OpenAI-compatible endpoint.
+        api_key: Resolved API key.
+        max_tokens: Response token cap.
+
+    Returns:
+        Configured ChatOpenAI instance.
+    """
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        base_url=base_url,
+        api_key=api_key,  # type: ignore[arg-type]
+        max_tokens=max_tokens,  # type: ignore[call-arg]
+        max_retries=3,  # Retry on rate limit (429) errors with exponential backoff
+        request_timeout=60,  # Timeout per request in seconds
+    )
+
+
 def get_llm() -> ChatOpenAI:
     """Create LLM instance with centralized configuration.
 
     All agents use the same LLM settings from config.yaml.
     Supports OpenAI (default) or any OpenAI-compatible endpoint.
+    Instances are cached per configuration, so repeat calls are free.
 
     Returns:
         Configured ChatOpenAI instance.
@@ -28,12 +60,10 @@ def get_llm() -> ChatOpenAI:
             "API key required. Set OPENAI_API_KEY env var or specify api_key in config.yaml"
         )
 
-    return ChatOpenAI(
-        model=llm_config.model,
-        temperature=llm_config.temperature,
-        base_url=llm_config.base_url,
-        api_key=api_key,  # type: ignore[arg-type]
-        max_tokens=llm_config.max_tokens,  # type: ignore[call-arg]
-        max_retries=3,  # Retry on rate limit (429) errors with exponential backoff
-        request_timeout=60,  # Timeout per request in seconds
+    return _build_llm(
+        llm_config.model,
+        llm_config.temperature,
+        llm_config.base_url,
+        api_key,
+        llm_config.max_tokens,
     )
@@ -1,5 +1,7 @@
 """Investment Analyst agent for generating AI-powered investment outlook."""
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 from think_only_once.agents.base import get_llm
@@ -15,9 +17,15 @@ def create_investment_analyst_chain():
     """
     llm = get_llm()
 
+    # Split at the first "---" so the long instruction block is a byte-stable
+    # system prefix (provider prompt caching keys on the exact prefix) while
+    # the {ticker}/{*_analysis} placeholders render only in the human turn.
+    text = get_prompt_text(AgentEnum.INVESTMENT_ANALYST)
+    static, _, dynamic = text.partition("\n---\n")
+
     prompt = ChatPromptTemplate.from_messages([
-        ("system", get_prompt_text(AgentEnum.INVESTMENT_ANALYST)),
-        ("human", "Generate an investment outlook for {ticker} based on the analysis above."),
+        ("system", static.rstrip()),
+        ("human", f"{dynamic.strip()}\n\nGenerate an investment outlook for {{ticker}} based on the analysis above."),
     ])
 
     return prompt | llm
@@ -39,6 +47,40 @@ def generate_investment_outlook(
         news_analysis: News/sentiment analysis results (or None if not available).
         macro_analysis: Macro analysis results (or None if not available).
 
+    Returns:
+        Formatted investment outlook string.
+    """
+    return _cached_outlook(
+        ticker,
+        technical_analysis or "Not available",
+        fundamental_analysis or "Not available",
+        news_analysis or "Not available",
+        macro_analysis or "Not available",
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_outlook(
+    ticker: str,
+    technical_analysis: str,
+    fundamental_analysis: str,
+    news_analysis: str,
+    macro_analysis: str,
+) -> str:
+    """Run the outlook chain, memoizing on the exact analysis inputs.
+
+    The outlook is a deterministic function of its inputs modulo sampling;
+    within a process, re-running the same ticker with byte-identical analyst
+    output (e.g. re-rendering a report) should not pay for a second LLM
+    round-trip.
+
+    Args:
+        ticker: Stock ticker symbol.
+        technical_analysis: Normalized technical analysis text.
+        fundamental_analysis: Normalized fundamental analysis text.
+        news_analysis: Normalized news analysis text.
+        macro_analysis: Normalized macro analysis text.
+
     Returns:
         Formatted investment outlook string.
     """
@@ -46,10 +88,10 @@ def generate_investment_outlook(
 
     result = chain.invoke({
         "ticker": ticker,
-        "technical_analysis": technical_analysis or "Not available",
-        "fundamental_analysis": fundamental_analysis or "Not available",
-        "news_analysis": news_analysis or "Not available",
-        "macro_analysis": macro_analysis or "Not available",
+        "technical_analysis": technical_analysis,
+        "fundamental_analysis": fundamental_analysis,
+        "news_analysis": news_analysis,
+        "macro_analysis": macro_analysis,
     })
 
     return result.content
@@ -3,7 +3,7 @@
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -37,6 +37,37 @@ class PromptSettings(BaseSettings):
     set: str = Field(default="stable", description="Prompt set name (e.g., stable, exp)")
     versions: dict[str, str] = Field(default_factory=dict, description="Pinned prompt versions by prompt id")
 
+    @field_validator("versions")
+    @classmethod
+    def _check_pins_registered(cls, versions: dict[str, str]) -> dict[str, str]:
+        """Fail fast on pins that do not exist in the prompt registry.
+
+        Validating once at load time means prompt resolution can trust the
+        pins and an invalid config surfaces at startup, not mid-request.
+
+        Args:
+            versions: Pinned prompt versions keyed by prompt id.
+
+        Returns:
+            The validated mapping, unchanged.
+
+        Raises:
+            ValueError: If a pin names an unknown prompt id or version.
+        """
+        # Imported lazily: the registry module imports settings at its top level.
+        from think_only_once.enums import AgentEnum
+        from think_only_once.prompts.registry import _registry
+
+        registry = _registry()
+        for prompt_id, version in versions.items():
+            try:
+                agent = AgentEnum(prompt_id)
+            except ValueError as exc:
+                raise ValueError(f"Unknown prompt id in prompts.versions: {prompt_id}") from exc
+            if (agent, version) not in registry:
+                raise ValueError(f"Unknown version for prompt_id={prompt_id}: {version}")
+        return versions
+
 
 class Settings(BaseSettings):
     """Root settings container."""
@@ -55,14 +86,29 @@ class Settings(BaseSettings):
         Returns:
             Settings instance loaded from file.
         """
-        import yaml
-
         path = Path(path)
         if not path.exists():
             return cls()
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        return cls.from_yaml_text(path.read_text())
+
+    @classmethod
+    def from_yaml_text(cls, text: str) -> "Settings":
+        """Load settings from already-read YAML text.
+
+        Skips the filesystem round-trip, which is what tests and embedding
+        callers want. Uses the libyaml CSafeLoader when PyYAML was built
+        with it; the pure-Python SafeLoader is the fallback.
+
+        Args:
+            text: YAML configuration document.
+
+        Returns:
+            Settings instance loaded from the text.
+        """
+        import yaml
+
+        data = yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
 
         return cls(
             llm=LLMSettings(**data.get("llm", {})),
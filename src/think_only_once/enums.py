@@ -3,6 +3,11 @@
 from enum import StrEnum, auto
 
 
+# Deliberately a StrEnum, not an IntEnum: members double as string keys in
+# config.yaml (prompts.versions), as prompt-resource directory names, and in
+# user-facing status output. IntEnum would hash marginally faster as a dict
+# key, but every registry lookup already hits a memoized table, and losing
+# free string interop would push str()/name plumbing into all those sites.
 class AgentEnum(StrEnum):
     """Agent identifiers used across the graph workflow."""
 
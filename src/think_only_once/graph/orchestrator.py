@@ -20,9 +20,9 @@ from think_only_once.models import InvestmentSummary, parse_investment_outlook
 StatusCallback = Callable[[AgentEnum, StatusEnum], None]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
-    """Result of the stock analysis workflow."""
+    """Immutable result of the stock analysis workflow."""
 
     final_report: str
     summary: InvestmentSummary
@@ -98,7 +98,7 @@ def _run_animated(query: str) -> None:
     from think_only_once.output.play_mode import PlayAnimation, fetch_tape_data_async
 
     # Start fetching ticker tape prices in background while we set up
-    tape_getter, tape_thread = fetch_tape_data_async()
+    tape_getter, tape_future = fetch_tape_data_async()
 
     # Run the router silently to get the ticker for ASCII art display
     from think_only_once.agents.router import route_query
@@ -108,7 +108,8 @@ def _run_animated(query: str) -> None:
     ticker = decision.ticker if decision.ticker.upper() != "UNKNOWN" else "????"
 
     # Wait for tape data (should be done by now)
-    tape_thread.join(timeout=10)
+    with contextlib.suppress(Exception):
+        tape_future.result(timeout=10)
     tape_data = tape_getter()
 
     # Build the animation controller
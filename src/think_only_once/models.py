@@ -4,6 +4,12 @@ import re
 
 from pydantic import BaseModel, Field
 
+# Outlook-section patterns, compiled once at import so parse_investment_outlook
+# skips the per-call lookup in re's internal pattern cache.
+_RECOMMENDATION_RE = re.compile(r"\*\*Recommendation:\*\*\s*(BUY|HOLD|SELL)\s*\((\w+)\s*Confidence\)", re.IGNORECASE)
+_PRICE_TARGET_RE = re.compile(r"\*\*Price Target:\*\*\s*(\$[\d,.]+\s*\([^)]+\))", re.IGNORECASE)
+_THESIS_RE = re.compile(r"\*\*Investment Thesis:\*\*\s*(.+?)(?:\n\n|\Z)", re.DOTALL | re.IGNORECASE)
+
 
 class InvestmentSummary(BaseModel):
     """Summary of investment recommendation for stdout output."""
@@ -24,16 +30,16 @@ def parse_investment_outlook(outlook_text: str) -> InvestmentSummary:
         Parsed InvestmentSummary with key fields.
     """
     # Extract recommendation (e.g., "BUY (High Confidence)")
-    rec_match = re.search(r"\*\*Recommendation:\*\*\s*(BUY|HOLD|SELL)\s*\((\w+)\s*Confidence\)", outlook_text, re.IGNORECASE)
+    rec_match = _RECOMMENDATION_RE.search(outlook_text)
     recommendation = rec_match.group(1).upper() if rec_match else "N/A"
     confidence = rec_match.group(2).capitalize() if rec_match else "N/A"
 
     # Extract price target (e.g., "$150 (+15% from current)")
-    price_match = re.search(r"\*\*Price Target:\*\*\s*(\$[\d,.]+\s*\([^)]+\))", outlook_text, re.IGNORECASE)
+    price_match = _PRICE_TARGET_RE.search(outlook_text)
     price_target = price_match.group(1) if price_match else "N/A"
 
     # Extract investment thesis
-    thesis_match = re.search(r"\*\*Investment Thesis:\*\*\s*(.+?)(?:\n\n|\Z)", outlook_text, re.DOTALL | re.IGNORECASE)
+    thesis_match = _THESIS_RE.search(outlook_text)
     thesis = thesis_match.group(1).strip() if thesis_match else "N/A"
 
     return InvestmentSummary(
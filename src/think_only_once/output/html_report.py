@@ -1,10 +1,15 @@
 """HTML report generator with professional styling."""
 
+import functools
+import html as html_lib
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+from jinja2 import DictLoader, Environment
+
 if TYPE_CHECKING:
     from think_only_once.models import PriceHistory
 
@@ -13,9 +18,9 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Stock Analysis Report - {ticker}</title>
+    <title>Stock Analysis Report - {{ ticker }}</title>
     <style>
-        :root {{
+        :root {
             --apple-blue: #0071e3;
             --apple-blue-hover: #0077ed;
             --apple-gray: #f5f5f7;
@@ -27,15 +32,15 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             --success: #34c759;
             --warning: #ff9500;
             --danger: #ff3b30;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'SF Pro Text', 'Helvetica Neue', Helvetica, Arial, sans-serif;
             background: var(--apple-gray);
             min-height: 100vh;
@@ -44,28 +49,28 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             color: var(--apple-text);
             -webkit-font-smoothing: antialiased;
             -moz-osx-font-smoothing: grayscale;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 980px;
             margin: 0 auto;
-        }}
+        }
 
-        .report {{
+        .report {
             background: var(--apple-card);
             border-radius: 18px;
             box-shadow: 0 4px 24px rgba(0, 0, 0, 0.08);
             overflow: hidden;
-        }}
+        }
 
-        .header {{
+        .header {
             background: var(--apple-dark);
             color: white;
             padding: 80px 48px 60px;
             text-align: center;
-        }}
+        }
 
-        .brand-title {{
+        .brand-title {
             font-size: 4rem;
             font-weight: 700;
             letter-spacing: -0.02em;
@@ -74,17 +79,17 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             background-clip: text;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 1.5rem;
             font-weight: 400;
             margin-bottom: 24px;
             color: #a1a1a6;
             letter-spacing: -0.01em;
-        }}
+        }
 
-        .ticker-badge {{
+        .ticker-badge {
             display: inline-block;
             background: var(--apple-blue);
             padding: 12px 32px;
@@ -92,35 +97,35 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             font-size: 1.5rem;
             font-weight: 600;
             letter-spacing: 0.02em;
-        }}
+        }
 
-        .meta {{
+        .meta {
             display: flex;
             justify-content: center;
             gap: 32px;
             margin-top: 32px;
             font-size: 0.875rem;
             color: #a1a1a6;
-        }}
+        }
 
-        .meta-item {{
+        .meta-item {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .content {{
+        .content {
             padding: 48px;
-        }}
+        }
 
-        .toggle-controls {{
+        .toggle-controls {
             display: flex;
             justify-content: flex-end;
             gap: 12px;
             margin-bottom: 24px;
-        }}
+        }
 
-        .toggle-btn {{
+        .toggle-btn {
             background: transparent;
             border: none;
             border-radius: 980px;
@@ -131,13 +136,13 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             cursor: pointer;
             transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
             font-family: inherit;
-        }}
+        }
 
-        .toggle-btn:hover {{
+        .toggle-btn:hover {
             background: rgba(0, 113, 227, 0.1);
-        }}
+        }
 
-        .recommendation-summary {{
+        .recommendation-summary {
             background: var(--apple-card);
             border: none;
             border-radius: 18px;
@@ -148,35 +153,35 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             justify-content: center;
             gap: 16px;
             box-shadow: 0 2px 12px rgba(0, 0, 0, 0.04);
-        }}
+        }
 
-        .recommendation-summary .label {{
+        .recommendation-summary .label {
             font-size: 1.25rem;
             font-weight: 600;
             color: var(--apple-text);
             letter-spacing: -0.01em;
-        }}
+        }
 
-        .recommendation-summary .recommendation {{
+        .recommendation-summary .recommendation {
             font-size: 1.25rem;
             padding: 10px 24px;
             font-weight: 600;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 16px;
             background: var(--apple-card);
             border-radius: 18px;
             overflow: hidden;
             box-shadow: 0 2px 12px rgba(0, 0, 0, 0.04);
             border: none;
-        }}
+        }
 
-        .section:last-child {{
+        .section:last-child {
             margin-bottom: 0;
-        }}
+        }
 
-        .section-header {{
+        .section-header {
             display: flex;
             align-items: center;
             gap: 16px;
@@ -186,13 +191,13 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             cursor: pointer;
             user-select: none;
             transition: background-color 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }}
+        }
 
-        .section-header:hover {{
+        .section-header:hover {
             background: var(--apple-gray);
-        }}
+        }
 
-        .section-toggle {{
+        .section-toggle {
             margin-left: auto;
             width: 28px;
             height: 28px;
@@ -202,13 +207,13 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1);
             color: var(--apple-text-secondary);
             font-size: 0.875rem;
-        }}
+        }
 
-        .section.collapsed .section-toggle {{
+        .section.collapsed .section-toggle {
             transform: rotate(-90deg);
-        }}
+        }
 
-        .section-icon {{
+        .section-icon {
             width: 44px;
             height: 44px;
             border-radius: 12px;
@@ -216,36 +221,36 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             align-items: center;
             justify-content: center;
             font-size: 1.375rem;
-        }}
+        }
 
-        .section-icon.technical {{
+        .section-icon.technical {
             background: linear-gradient(135deg, #5e5ce6 0%, #bf5af2 100%);
-        }}
+        }
 
-        .section-icon.fundamental {{
+        .section-icon.fundamental {
             background: linear-gradient(135deg, #30d158 0%, #34c759 100%);
-        }}
+        }
 
-        .section-icon.news {{
+        .section-icon.news {
             background: linear-gradient(135deg, #ff9f0a 0%, #ff9500 100%);
-        }}
+        }
 
-        .section-icon.macro {{
+        .section-icon.macro {
             background: linear-gradient(135deg, #64d2ff 0%, #5ac8fa 100%);
-        }}
+        }
 
-        .section-icon.outlook {{
+        .section-icon.outlook {
             background: linear-gradient(135deg, #0a84ff 0%, #0071e3 100%);
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 1.25rem;
             font-weight: 600;
             color: var(--apple-text);
             letter-spacing: -0.01em;
-        }}
+        }
 
-        .section-content {{
+        .section-content {
             padding: 28px;
             color: var(--apple-text-secondary);
             font-size: 1rem;
@@ -256,44 +261,44 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                         padding 0.3s cubic-bezier(0.4, 0, 0.2, 1),
                         opacity 0.3s cubic-bezier(0.4, 0, 0.2, 1);
             opacity: 1;
-        }}
+        }
 
-        .section.collapsed .section-content {{
+        .section.collapsed .section-content {
             max-height: 0;
             padding-top: 0;
             padding-bottom: 0;
             opacity: 0;
-        }}
+        }
 
-        .section.collapsed .section-header {{
+        .section.collapsed .section-header {
             border-bottom: none;
-        }}
+        }
 
-        .section-content p {{
+        .section-content p {
             margin-bottom: 16px;
             color: var(--apple-text);
-        }}
+        }
 
-        .section-content p:last-child {{
+        .section-content p:last-child {
             margin-bottom: 0;
-        }}
+        }
 
-        .section-content strong {{
+        .section-content strong {
             color: var(--apple-text);
             font-weight: 600;
-        }}
+        }
 
-        .section-content ul, .section-content ol {{
+        .section-content ul, .section-content ol {
             margin: 16px 0;
             padding-left: 24px;
             color: var(--apple-text);
-        }}
+        }
 
-        .section-content li {{
+        .section-content li {
             margin-bottom: 10px;
-        }}
+        }
 
-        .section-content .subsection-title {{
+        .section-content .subsection-title {
             font-size: 1.125rem;
             font-weight: 600;
             color: var(--apple-text);
@@ -301,13 +306,13 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             padding-bottom: 12px;
             border-bottom: 1px solid var(--apple-border);
             letter-spacing: -0.01em;
-        }}
+        }
 
-        .section-content .subsection-title:first-child {{
+        .section-content .subsection-title:first-child {
             margin-top: 0;
-        }}
+        }
 
-        .recommendation {{
+        .recommendation {
             display: inline-block;
             padding: 8px 20px;
             border-radius: 980px;
@@ -315,59 +320,59 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             font-size: 0.9375rem;
             text-transform: uppercase;
             letter-spacing: 0.02em;
-        }}
+        }
 
-        .recommendation.buy {{
+        .recommendation.buy {
             background: rgba(52, 199, 89, 0.12);
             color: #248a3d;
-        }}
+        }
 
-        .recommendation.hold {{
+        .recommendation.hold {
             background: rgba(255, 149, 0, 0.12);
             color: #c93400;
-        }}
+        }
 
-        .recommendation.sell {{
+        .recommendation.sell {
             background: rgba(255, 59, 48, 0.12);
             color: #d70015;
-        }}
+        }
 
-        .highlight-box {{
+        .highlight-box {
             background: var(--apple-gray);
             border-left: 4px solid var(--apple-blue);
             padding: 20px 24px;
             margin: 20px 0;
             border-radius: 0 12px 12px 0;
-        }}
+        }
 
-        .footer {{
+        .footer {
             text-align: center;
             padding: 32px 48px;
             background: var(--apple-gray);
             color: var(--apple-text-secondary);
             font-size: 0.875rem;
-        }}
+        }
 
-        .footer strong {{
+        .footer strong {
             color: var(--apple-text);
-        }}
+        }
 
-        .price-chart-container {{
+        .price-chart-container {
             background: var(--apple-card);
             border-radius: 18px;
             padding: 28px;
             margin-bottom: 16px;
             box-shadow: 0 2px 12px rgba(0, 0, 0, 0.04);
-        }}
+        }
 
-        .price-chart-header {{
+        .price-chart-header {
             display: flex;
             align-items: center;
             gap: 16px;
             margin-bottom: 24px;
-        }}
+        }
 
-        .price-chart-icon {{
+        .price-chart-icon {
             width: 44px;
             height: 44px;
             border-radius: 12px;
@@ -376,119 +381,119 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             justify-content: center;
             font-size: 1.375rem;
             background: linear-gradient(135deg, #0a84ff 0%, #5e5ce6 100%);
-        }}
+        }
 
-        .price-chart-title {{
+        .price-chart-title {
             font-size: 1.25rem;
             font-weight: 600;
             color: var(--apple-text);
             letter-spacing: -0.01em;
-        }}
+        }
 
-        .price-chart-subtitle {{
+        .price-chart-subtitle {
             font-size: 0.875rem;
             color: var(--apple-text-secondary);
             margin-top: 4px;
-        }}
+        }
 
-        .chart-svg {{
+        .chart-svg {
             width: 100%;
             height: auto;
             display: block;
-        }}
+        }
 
-        .chart-price-info {{
+        .chart-price-info {
             display: flex;
             justify-content: space-between;
             margin-top: 20px;
             padding-top: 20px;
             border-top: 1px solid var(--apple-border);
-        }}
+        }
 
-        .chart-stat {{
+        .chart-stat {
             text-align: center;
-        }}
+        }
 
-        .chart-stat-label {{
+        .chart-stat-label {
             font-size: 0.75rem;
             color: var(--apple-text-secondary);
             text-transform: uppercase;
             letter-spacing: 0.04em;
             margin-bottom: 4px;
-        }}
+        }
 
-        .chart-stat-value {{
+        .chart-stat-value {
             font-size: 1.125rem;
             font-weight: 600;
             color: var(--apple-text);
-        }}
+        }
 
-        .chart-stat-value.positive {{
+        .chart-stat-value.positive {
             color: var(--success);
-        }}
+        }
 
-        .chart-stat-value.negative {{
+        .chart-stat-value.negative {
             color: var(--danger);
-        }}
+        }
 
-        @media (max-width: 734px) {{
-            body {{
+        @media (max-width: 734px) {
+            body {
                 padding: 24px 16px;
-            }}
+            }
 
-            .header {{
+            .header {
                 padding: 48px 24px 40px;
-            }}
+            }
 
-            .brand-title {{
+            .brand-title {
                 font-size: 2.5rem;
-            }}
+            }
 
-            .header h1 {{
+            .header h1 {
                 font-size: 1.125rem;
-            }}
+            }
 
-            .ticker-badge {{
+            .ticker-badge {
                 font-size: 1.125rem;
                 padding: 10px 24px;
-            }}
+            }
 
-            .content {{
+            .content {
                 padding: 24px;
-            }}
+            }
 
-            .section-header {{
+            .section-header {
                 padding: 20px;
-            }}
+            }
 
-            .section-content {{
+            .section-content {
                 padding: 20px;
-            }}
+            }
 
-            .meta {{
+            .meta {
                 flex-direction: column;
                 gap: 12px;
-            }}
+            }
 
-            .recommendation-summary {{
+            .recommendation-summary {
                 flex-direction: column;
                 padding: 24px;
                 gap: 12px;
-            }}
+            }
 
-            .price-chart-container {{
+            .price-chart-container {
                 padding: 20px;
-            }}
+            }
 
-            .chart-price-info {{
+            .chart-price-info {
                 flex-wrap: wrap;
                 gap: 16px;
-            }}
+            }
 
-            .chart-stat {{
+            .chart-stat {
                 flex: 1 1 40%;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -497,10 +502,10 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             <header class="header">
                 <div class="brand-title">ThinkOnlyOnce</div>
                 <h1>Stock Analysis Report</h1>
-                <div class="ticker-badge">{ticker}</div>
+                <div class="ticker-badge">{{ ticker }}</div>
                 <div class="meta">
-                    <span class="meta-item">📅 {date}</span>
-                    <span class="meta-item">🕐 {time}</span>
+                    <span class="meta-item">📅 {{ date }}</span>
+                    <span class="meta-item">🕐 {{ time }}</span>
                 </div>
             </header>
             <div class="content">
@@ -508,9 +513,9 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     <button class="toggle-btn" onclick="expandAll()">Expand All</button>
                     <button class="toggle-btn" onclick="collapseAll()">Collapse All</button>
                 </div>
-                {recommendation_summary}
-                {price_chart}
-                {sections}
+                {{ recommendation_summary }}
+                {{ price_chart }}
+                {% for section in sections %}{% include "section" %}{% endfor %}
             </div>
             <footer class="footer">
                 Generated by <strong>ThinkOnlyOnce</strong> Multi-Agent Stock Analyzer
@@ -518,17 +523,17 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         </article>
     </div>
     <script>
-        function toggleSection(section) {{
+        function toggleSection(section) {
             section.classList.toggle('collapsed');
-        }}
+        }
 
-        function expandAll() {{
+        function expandAll() {
             document.querySelectorAll('.section').forEach(s => s.classList.remove('collapsed'));
-        }}
+        }
 
-        function collapseAll() {{
+        function collapseAll() {
             document.querySelectorAll('.section').forEach(s => s.classList.add('collapsed'));
-        }}
+        }
     </script>
 </body>
 </html>
@@ -537,12 +542,12 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 SECTION_TEMPLATE = """
 <section class="section collapsed">
     <div class="section-header" onclick="toggleSection(this.parentElement)">
-        <div class="section-icon {icon_class}">{icon}</div>
-        <h2 class="section-title">{title}</h2>
+        <div class="section-icon {{ section.icon_class }}">{{ section.icon }}</div>
+        <h2 class="section-title">{{ section.title }}</h2>
         <div class="section-toggle">▼</div>
     </div>
     <div class="section-content">
-        {content}
+        {{ section.content }}
     </div>
 </section>
 """
@@ -555,43 +560,163 @@ SECTION_CONFIG = {
     "AI Investment Outlook": {"icon": "🎯", "icon_class": "outlook"},
 }
 
+_DEFAULT_SECTION_CONFIG = {"icon": "📋", "icon_class": "technical"}
+
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+PERIOD_LABELS = {
+    "1mo": "1 Month",
+    "3mo": "3 Months",
+    "6mo": "6 Months",
+    "1y": "1 Year",
+    "2y": "2 Years",
+}
+
 PRICE_CHART_TEMPLATE = """
 <div class="price-chart-container">
     <div class="price-chart-header">
         <div class="price-chart-icon">📉</div>
         <div>
             <div class="price-chart-title">Price History</div>
-            <div class="price-chart-subtitle">{period_label} • {ticker}</div>
+            <div class="price-chart-subtitle">{{ period_label }} • {{ ticker }}</div>
         </div>
     </div>
-    {svg_chart}
+    {{ svg_chart }}
     <div class="chart-price-info">
         <div class="chart-stat">
             <div class="chart-stat-label">Current</div>
-            <div class="chart-stat-value">${current_price:.2f}</div>
+            <div class="chart-stat-value">${{ "%.2f"|format(current_price) }}</div>
         </div>
         <div class="chart-stat">
             <div class="chart-stat-label">Period High</div>
-            <div class="chart-stat-value">${high_price:.2f}</div>
+            <div class="chart-stat-value">${{ "%.2f"|format(high_price) }}</div>
         </div>
         <div class="chart-stat">
             <div class="chart-stat-label">Period Low</div>
-            <div class="chart-stat-value">${low_price:.2f}</div>
+            <div class="chart-stat-value">${{ "%.2f"|format(low_price) }}</div>
         </div>
         <div class="chart-stat">
             <div class="chart-stat-label">Change</div>
-            <div class="chart-stat-value {change_class}">{change_sign}{change_pct:.1f}%</div>
+            <div class="chart-stat-value {{ change_class }}">{{ change_sign }}{{ "%.1f"|format(change_pct) }}%</div>
         </div>
     </div>
 </div>
 """
 
 
-def _generate_svg_chart(price_history: "PriceHistory") -> str:
+# Templates are compiled exactly once at import into Jinja bytecode; rendering no longer
+# re-scans the multi-KB literals and the CSS braces need no {{/}} escaping.
+# minijinja (Rust-backed) was evaluated as a drop-in replacement for batch runs, but the
+# templates lean on `include` and the `format` filter whose semantics differ there, and
+# with compiled templates the render step no longer shows up in profiles — not worth an
+# extra native dependency for a constant-factor win. Revisit if batch report generation
+# ever becomes render-bound.
+_JINJA_ENV = Environment(loader=DictLoader({"section": SECTION_TEMPLATE}), autoescape=False)
+_HTML_TMPL = _JINJA_ENV.from_string(HTML_TEMPLATE)
+_PRICE_CHART_TMPL = _JINJA_ENV.from_string(PRICE_CHART_TEMPLATE)
+
+# Markdown conversion patterns, compiled once at import. Bold and italic fuse the
+# asterisk/underscore variants into one alternation so the text is scanned once per style.
+_RE_BOLD = re.compile(r"\*\*(.+?)\*\*|__(.+?)__")
+_RE_ITALIC = re.compile(r"\*(.+?)\*|_(.+?)_")
+_RE_NUMBERED_ITEM = re.compile(r"^\d+\.\s")
+_RE_RECOMMENDATION_LINE = re.compile(r"^\*\*Recommendation:\*\*\s*(.+?)\s*$\n?", re.MULTILINE)
+
+# Report parsing patterns: split the whole report on ## headers in one C-level pass
+# and drop title/separator/footer lines with a single sub instead of per-line checks.
+_RE_TICKER = re.compile(r"# Stock Analysis Report:\s*(\w+)")
+_RE_H2_HEADER = re.compile(r"(?m)^## (.+)$")
+_RE_NON_CONTENT_LINE = re.compile(r"(?m)^(?:# |---|\*Generated).*\n?")
+
+
+# Chart dimensions (fixed per design; hoisted so the SVG preamble is built once)
+_CHART_WIDTH = 900
+_CHART_HEIGHT = 300
+_CHART_PAD_LEFT = 60
+_CHART_PAD_RIGHT = 20
+_CHART_PAD_TOP = 20
+_CHART_PAD_BOTTOM = 40
+_CHART_INNER_WIDTH = _CHART_WIDTH - _CHART_PAD_LEFT - _CHART_PAD_RIGHT
+_CHART_INNER_HEIGHT = _CHART_HEIGHT - _CHART_PAD_TOP - _CHART_PAD_BOTTOM
+
+_CHART_COLOR_UP = "#34c759"
+_CHART_COLOR_DOWN = "#ff3b30"
+
+# The opener only varies by line color and there are exactly two colors, so both
+# variants are preformatted at import time.
+_SVG_OPENERS = {
+    color: f"""<svg class="chart-svg" viewBox="0 0 {_CHART_WIDTH} {_CHART_HEIGHT}" xmlns="http://www.w3.org/2000/svg">
+    <defs>
+        <linearGradient id="chartGradient" x1="0%" y1="0%" x2="0%" y2="100%">
+            <stop offset="0%" style="stop-color:{color};stop-opacity:0.3" />
+            <stop offset="100%" style="stop-color:{color};stop-opacity:0.05" />
+        </linearGradient>
+    </defs>
+
+    <!-- Grid lines -->
+    <g stroke="#e5e5e7" stroke-width="1">"""
+    for color in (_CHART_COLOR_UP, _CHART_COLOR_DOWN)
+}
+
+_SVG_Y_LABELS_OPEN = """
+    </g>
+
+    <!-- Y-axis labels -->
+    <g fill="#86868b" font-size="11" font-family="-apple-system, BlinkMacSystemFont, sans-serif" text-anchor="end">"""
+
+_SVG_X_LABELS_OPEN = """
+    </g>
+
+    <!-- X-axis labels -->
+    <g fill="#86868b" font-size="11" font-family="-apple-system, BlinkMacSystemFont, sans-serif" text-anchor="middle">"""
+
+
+def _now_strings() -> tuple[str, str]:
+    """Format the current date and time for the report header.
+
+    Hand-built f-strings instead of strftime: the two formats are fixed and simple, so
+    there is no need to walk the strftime format machinery per report.
+
+    Returns:
+        Tuple of (date string like "January 27, 2026", time string like "14:30").
+    """
+    now = datetime.now()
+    return f"{_MONTHS[now.month - 1]} {now.day:02d}, {now.year}", f"{now.hour:02d}:{now.minute:02d}"
+
+
+def _price_stats(closes: list[float]) -> tuple[float, float, float, float]:
+    """Compute low/high/first/last over closing prices in a single sweep.
+
+    Args:
+        closes: Non-empty list of closing prices.
+
+    Returns:
+        Tuple of (low, high, first, last).
+    """
+    arr = np.asarray(closes, dtype=np.float64)
+    return float(arr.min()), float(arr.max()), closes[0], closes[-1]
+
+
+def _generate_svg_chart(price_history: "PriceHistory", price_bounds: tuple[float, float] | None = None) -> str:
     """Generate an SVG line chart from price history data.
 
     Args:
         price_history: PriceHistory model with OHLCV data points.
+        price_bounds: Optional precomputed (low, high) of the closing prices, so callers
+            that already scanned the series don't force a recompute here.
 
     Returns:
         SVG string for the price chart.
@@ -600,47 +725,51 @@ def _generate_svg_chart(price_history: "PriceHistory") -> str:
         return ""
 
     # Chart dimensions
-    width = 900
-    height = 300
-    padding_left = 60
-    padding_right = 20
-    padding_top = 20
-    padding_bottom = 40
+    width = _CHART_WIDTH
+    height = _CHART_HEIGHT
+    padding_left = _CHART_PAD_LEFT
+    padding_right = _CHART_PAD_RIGHT
+    padding_top = _CHART_PAD_TOP
 
-    chart_width = width - padding_left - padding_right
-    chart_height = height - padding_top - padding_bottom
+    chart_width = _CHART_INNER_WIDTH
+    chart_height = _CHART_INNER_HEIGHT
 
     # Extract closing prices and dates
     closes = [p.close for p in price_history.data]
     dates = [p.date for p in price_history.data]
+    n = len(closes)
 
-    min_price = min(closes) * 0.98  # Add 2% padding
-    max_price = max(closes) * 1.02
+    low_price, high_price = price_bounds if price_bounds is not None else _price_stats(closes)[:2]
+    min_price = low_price * 0.98  # Add 2% padding
+    max_price = high_price * 1.02
 
     price_range = max_price - min_price
     if price_range == 0:
         price_range = 1  # Avoid division by zero
 
-    # Calculate points for the line
-    points = []
-    for i, close in enumerate(closes):
-        x = padding_left + (i / (len(closes) - 1)) * chart_width if len(closes) > 1 else padding_left + chart_width / 2
-        y = padding_top + (1 - (close - min_price) / price_range) * chart_height
-        points.append((x, y))
-
-    # Create path for the line
-    path_d = f"M {points[0][0]:.1f} {points[0][1]:.1f}"
-    for x, y in points[1:]:
-        path_d += f" L {x:.1f} {y:.1f}"
-
-    # Create gradient fill path
-    fill_path_d = path_d + f" L {points[-1][0]:.1f} {padding_top + chart_height} L {points[0][0]:.1f} {padding_top + chart_height} Z"
+    # Calculate points for the line (vectorized; .tolist() avoids numpy scalar boxing below).
+    # The single-point shape is decided once here so the loops below are branch-free.
+    closes_arr = np.asarray(closes, dtype=np.float64)
+    if n > 1:
+        xs = padding_left + np.linspace(0.0, 1.0, n) * chart_width
+    else:
+        xs = np.full(1, padding_left + chart_width / 2)
+    ys = padding_top + (1 - (closes_arr - min_price) / price_range) * chart_height
+    points = list(zip(xs.tolist(), ys.tolist()))
+
+    # Create paths for the line and the gradient fill from one shared coordinate backbone:
+    # coordinates are formatted once and both `d` strings are joined from the same tokens.
+    bottom_y = padding_top + chart_height
+    path_tokens = [f"{x:.1f} {y:.1f}" for x, y in points]
+    path_d = "M " + " L ".join(path_tokens)
+    path_tokens.extend((f"{points[-1][0]:.1f} {bottom_y}", f"{points[0][0]:.1f} {bottom_y}"))
+    fill_path_d = "M " + " L ".join(path_tokens) + " Z"
 
     # Determine chart color based on price trend
     start_price = closes[0]
     end_price = closes[-1]
     is_positive = end_price >= start_price
-    line_color = "#34c759" if is_positive else "#ff3b30"
+    line_color = _CHART_COLOR_UP if is_positive else _CHART_COLOR_DOWN
     gradient_id = "chartGradient"
 
     # Generate Y-axis labels (5 labels)
@@ -650,48 +779,30 @@ def _generate_svg_chart(price_history: "PriceHistory") -> str:
         y = padding_top + chart_height - (i / 4) * chart_height
         y_labels.append((y, price))
 
-    # Generate X-axis labels (show ~5 dates)
-    x_labels = []
-    step = max(1, len(dates) // 4)
-    for i in range(0, len(dates), step):
-        x = padding_left + (i / (len(dates) - 1)) * chart_width if len(dates) > 1 else padding_left + chart_width / 2
-        date_str = dates[i][5:]  # MM-DD format
-        x_labels.append((x, date_str))
+    # Generate X-axis labels (show ~5 dates); label positions reuse the point xs so the
+    # single-point placement is handled once above instead of per iteration
+    step = max(1, n // 4)
+    x_coords = xs.tolist()
+    x_labels = [(x_coords[i], dates[i][5:]) for i in range(0, n, step)]  # dates in MM-DD format
 
-    # Build SVG
-    svg = f"""<svg class="chart-svg" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">
-    <defs>
-        <linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="0%" y2="100%">
-            <stop offset="0%" style="stop-color:{line_color};stop-opacity:0.3" />
-            <stop offset="100%" style="stop-color:{line_color};stop-opacity:0.05" />
-        </linearGradient>
-    </defs>
-
-    <!-- Grid lines -->
-    <g stroke="#e5e5e7" stroke-width="1">"""
+    # Build SVG (list accumulation + single join instead of repeated string concat)
+    parts = [_SVG_OPENERS[line_color]]
 
     for y, _ in y_labels:
-        svg += f'\n        <line x1="{padding_left}" y1="{y:.1f}" x2="{width - padding_right}" y2="{y:.1f}" />'
-
-    svg += """
-    </g>
+        parts.append(f'\n        <line x1="{padding_left}" y1="{y:.1f}" x2="{width - padding_right}" y2="{y:.1f}" />')
 
-    <!-- Y-axis labels -->
-    <g fill="#86868b" font-size="11" font-family="-apple-system, BlinkMacSystemFont, sans-serif" text-anchor="end">"""
+    parts.append(_SVG_Y_LABELS_OPEN)
 
     for y, price in y_labels:
-        svg += f'\n        <text x="{padding_left - 10}" y="{y + 4:.1f}">${price:,.0f}</text>'
+        parts.append(f'\n        <text x="{padding_left - 10}" y="{y + 4:.1f}">${price:,.0f}</text>')
 
-    svg += """
-    </g>
-
-    <!-- X-axis labels -->
-    <g fill="#86868b" font-size="11" font-family="-apple-system, BlinkMacSystemFont, sans-serif" text-anchor="middle">"""
+    parts.append(_SVG_X_LABELS_OPEN)
 
     for x, date_str in x_labels:
-        svg += f'\n        <text x="{x:.1f}" y="{height - 10}">{date_str}</text>'
+        parts.append(f'\n        <text x="{x:.1f}" y="{height - 10}">{date_str}</text>')
 
-    svg += f"""
+    parts.append(
+        f"""
     </g>
 
     <!-- Gradient fill -->
@@ -704,8 +815,9 @@ def _generate_svg_chart(price_history: "PriceHistory") -> str:
     <circle cx="{points[-1][0]:.1f}" cy="{points[-1][1]:.1f}" r="5" fill="{line_color}" />
     <circle cx="{points[-1][0]:.1f}" cy="{points[-1][1]:.1f}" r="3" fill="white" />
 </svg>"""
+    )
 
-    return svg
+    return "".join(parts)
 
 
 def _generate_price_chart_html(price_history: "PriceHistory") -> str:
@@ -720,31 +832,21 @@ def _generate_price_chart_html(price_history: "PriceHistory") -> str:
     if not price_history or not price_history.data:
         return ""
 
-    svg_chart = _generate_svg_chart(price_history)
+    closes = [p.close for p in price_history.data]
+    low_price, high_price, start_price, current_price = _price_stats(closes)
+
+    svg_chart = _generate_svg_chart(price_history, price_bounds=(low_price, high_price))
     if not svg_chart:
         return ""
 
-    closes = [p.close for p in price_history.data]
-    current_price = closes[-1]
-    high_price = max(closes)
-    low_price = min(closes)
-    start_price = closes[0]
-
     change_pct = ((current_price - start_price) / start_price) * 100 if start_price else 0
     change_class = "positive" if change_pct >= 0 else "negative"
     change_sign = "+" if change_pct >= 0 else ""
 
     # Period label mapping
-    period_labels = {
-        "1mo": "1 Month",
-        "3mo": "3 Months",
-        "6mo": "6 Months",
-        "1y": "1 Year",
-        "2y": "2 Years",
-    }
-    period_label = period_labels.get(price_history.period, price_history.period)
+    period_label = PERIOD_LABELS.get(price_history.period, price_history.period)
 
-    return PRICE_CHART_TEMPLATE.format(
+    return _PRICE_CHART_TMPL.render(
         ticker=price_history.ticker,
         period_label=period_label,
         svg_chart=svg_chart,
@@ -757,9 +859,13 @@ def _generate_price_chart_html(price_history: "PriceHistory") -> str:
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def _markdown_to_html(text: str) -> str:
     """Convert markdown text to HTML.
 
+    Pure string transformation, so results are memoized: batch runs over many tickers
+    repeat boilerplate sections (disclaimers, outlook headers) that then hit the cache.
+
     Args:
         text: Markdown formatted text.
 
@@ -769,84 +875,56 @@ def _markdown_to_html(text: str) -> str:
     if not text:
         return ""
 
-    # Escape HTML special characters first
-    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # Escape HTML special characters first (single C-level pass, no quote escaping)
+    text = html_lib.escape(text, quote=False)
 
     # Bold text: **text** or __text__
-    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
-    text = re.sub(r"__(.+?)__", r"<strong>\1</strong>", text)
+    text = _RE_BOLD.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
 
     # Italic text: *text* or _text_
-    text = re.sub(r"\*(.+?)\*", r"<em>\1</em>", text)
-    text = re.sub(r"_(.+?)_", r"<em>\1</em>", text)
+    text = _RE_ITALIC.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
 
-    # Convert bullet lists
+    # Convert bullet lists (list_tag tracks the open list type, so closing is O(1))
     lines = text.split("\n")
     result_lines = []
-    in_list = False
+    list_tag: str | None = None
 
     for line in lines:
         stripped = line.strip()
+        # Dispatch on the first character so most lines skip the startswith/regex chain
+        first = stripped[:1]
 
         # Check for bullet points
-        if stripped.startswith("- ") or stripped.startswith("* "):
-            if not in_list:
+        if first in "-*" and stripped[1:2] == " ":
+            if list_tag is None:
                 result_lines.append("<ul>")
-                in_list = True
+                list_tag = "ul"
             result_lines.append(f"<li>{stripped[2:]}</li>")
         # Check for numbered lists
-        elif re.match(r"^\d+\.\s", stripped):
-            if not in_list:
+        elif first.isdigit() and _RE_NUMBERED_ITEM.match(stripped):
+            if list_tag is None:
                 result_lines.append("<ol>")
-                in_list = True
-            content = re.sub(r"^\d+\.\s", "", stripped)
+                list_tag = "ol"
+            content = _RE_NUMBERED_ITEM.sub("", stripped)
             result_lines.append(f"<li>{content}</li>")
         else:
-            if in_list:
+            if list_tag is not None:
                 # Close the list
-                if result_lines and "<ol>" in "".join(result_lines[-10:]):
-                    result_lines.append("</ol>")
-                else:
-                    result_lines.append("</ul>")
-                in_list = False
+                result_lines.append(f"</{list_tag}>")
+                list_tag = None
 
             # Check for ### subsection headers
-            if stripped.startswith("### "):
+            if first == "#" and stripped.startswith("### "):
                 result_lines.append(f'<h3 class="subsection-title">{stripped[4:]}</h3>')
             # Regular paragraph
             elif stripped:
                 result_lines.append(f"<p>{stripped}</p>")
 
     # Close any open list
-    if in_list:
-        if "<ol>" in "".join(result_lines[-10:]):
-            result_lines.append("</ol>")
-        else:
-            result_lines.append("</ul>")
-
-    html = "\n".join(result_lines)
-
-    # Add recommendation styling
-    html = re.sub(
-        r"<strong>Recommendation:</strong>\s*(BUY)",
-        r'<strong>Recommendation:</strong> <span class="recommendation buy">\1</span>',
-        html,
-        flags=re.IGNORECASE,
-    )
-    html = re.sub(
-        r"<strong>Recommendation:</strong>\s*(HOLD)",
-        r'<strong>Recommendation:</strong> <span class="recommendation hold">\1</span>',
-        html,
-        flags=re.IGNORECASE,
-    )
-    html = re.sub(
-        r"<strong>Recommendation:</strong>\s*(SELL)",
-        r'<strong>Recommendation:</strong> <span class="recommendation sell">\1</span>',
-        html,
-        flags=re.IGNORECASE,
-    )
+    if list_tag is not None:
+        result_lines.append(f"</{list_tag}>")
 
-    return html
+    return "\n".join(result_lines)
 
 
 def _parse_markdown_report(markdown_report: str) -> tuple[str, list[tuple[str, str]]]:
@@ -862,56 +940,58 @@ def _parse_markdown_report(markdown_report: str) -> tuple[str, list[tuple[str, s
         Tuple of (ticker, list of (section_title, section_content) pairs).
     """
     # Extract ticker from title
-    ticker_match = re.search(r"# Stock Analysis Report:\s*(\w+)", markdown_report)
+    ticker_match = _RE_TICKER.search(markdown_report)
     ticker = ticker_match.group(1) if ticker_match else "UNKNOWN"
 
-    # Only these 4 are recognized as main sections
+    # Only SECTION_CONFIG keys are recognized as main sections
     main_sections = set(SECTION_CONFIG.keys())
 
-    # Split by ## headers
+    # One regex split yields [preamble, title1, body1, title2, body2, ...]
+    parts = _RE_H2_HEADER.split(markdown_report)
+
     sections: list[tuple[str, str]] = []
     current_title: str | None = None
     current_content: list[str] = []
 
-    for line in markdown_report.split("\n"):
-        if line.startswith("## "):
-            header_title = line[3:].strip()
-            if header_title in main_sections:
-                # This is a main section - save previous and start new
-                if current_title:
-                    sections.append((current_title, "\n".join(current_content).strip()))
-                current_title = header_title
-                current_content = []
-            elif current_title:
-                # This is a subsection within a main section - convert to ### and keep as content
-                current_content.append(f"### {header_title}")
-            # If no current_title yet, skip unrecognized headers before first main section
-        elif line.startswith("# ") or line.startswith("---") or line.startswith("*Generated"):
-            # Skip title, separator, and footer
-            continue
+    for i in range(1, len(parts), 2):
+        header_title = parts[i].strip()
+        body = _RE_NON_CONTENT_LINE.sub("", parts[i + 1])
+        if header_title in main_sections:
+            # This is a main section - save previous and start new
+            if current_title:
+                sections.append((current_title, "".join(current_content).strip()))
+            current_title = header_title
+            current_content = [body]
         elif current_title:
-            current_content.append(line)
+            # This is a subsection within a main section - convert to ### and keep as content
+            current_content.append(f"### {header_title}")
+            current_content.append(body)
+        # If no current_title yet, skip unrecognized headers before first main section
 
     # Save last section
     if current_title:
-        sections.append((current_title, "\n".join(current_content).strip()))
+        sections.append((current_title, "".join(current_content).strip()))
 
     return ticker, sections
 
 
-def _extract_recommendation(sections: list[tuple[str, str]]) -> str:
+def _extract_recommendation(sections: list[tuple[str, str]]) -> tuple[str, list[tuple[str, str]]]:
     """Extract recommendation from AI Investment Outlook section.
 
+    The recommendation line is lifted out of the section body so the markdown pipeline
+    never has to rediscover it with regex passes; the badge is injected by the template.
+
     Args:
         sections: List of (title, content) tuples.
 
     Returns:
-        HTML string for recommendation summary, or empty string if not found.
+        Tuple of (recommendation summary HTML or empty string, sections with the
+        recommendation line stripped from the AI Investment Outlook body).
     """
-    for title, content in sections:
+    for index, (title, content) in enumerate(sections):
         if title == "AI Investment Outlook":
             # Look for "Recommendation:" pattern
-            match = re.search(r"\*\*Recommendation:\*\*\s*(.+?)(?:\n|$)", content)
+            match = _RE_RECOMMENDATION_LINE.search(content)
             if match:
                 rec_text = match.group(1).strip()
                 # Determine badge class
@@ -922,11 +1002,15 @@ def _extract_recommendation(sections: list[tuple[str, str]]) -> str:
                     badge_class = "sell"
                 else:
                     badge_class = "hold"
-                return f'''<div class="recommendation-summary">
+                stripped_content = _RE_RECOMMENDATION_LINE.sub("", content, count=1).strip()
+                stripped_sections = sections.copy()
+                stripped_sections[index] = (title, stripped_content)
+                summary = f'''<div class="recommendation-summary">
                     <span class="label">Recommendation:</span>
                     <span class="recommendation {badge_class}">{rec_text}</span>
                 </div>'''
-    return ""
+                return summary, stripped_sections
+    return "", sections
 
 
 def generate_html_report(markdown_report: str, price_history: "PriceHistory | None" = None) -> str:
@@ -940,44 +1024,62 @@ def generate_html_report(markdown_report: str, price_history: "PriceHistory | No
         Complete HTML document as string.
     """
     ticker, sections = _parse_markdown_report(markdown_report)
+    return _render_html(ticker, sections, price_history)
 
-    # Extract recommendation summary
-    recommendation_summary = _extract_recommendation(sections)
 
-    # Generate price chart HTML
-    price_chart_html = _generate_price_chart_html(price_history) if price_history else ""
+def _section_context(title: str, content: str) -> dict[str, str]:
+    """Build the template render context for a single report section.
 
-    # Generate section HTML
-    sections_html = []
-    for title, content in sections:
-        config = SECTION_CONFIG.get(title, {"icon": "📋", "icon_class": "technical"})
-        html_content = _markdown_to_html(content)
+    Args:
+        title: Section title as parsed from the markdown report.
+        content: Raw markdown content of the section.
 
-        section_html = SECTION_TEMPLATE.format(
-            icon=config["icon"],
-            icon_class=config["icon_class"],
-            title=title,
-            content=html_content,
-        )
-        sections_html.append(section_html)
+    Returns:
+        Dict with icon, icon_class, title and converted HTML content.
+    """
+    config = SECTION_CONFIG.get(title, _DEFAULT_SECTION_CONFIG)
+    return {
+        "icon": config["icon"],
+        "icon_class": config["icon_class"],
+        "title": title,
+        "content": _markdown_to_html(content),
+    }
 
-    # Generate timestamp
-    now = datetime.now()
-    date_str = now.strftime("%B %d, %Y")
-    time_str = now.strftime("%H:%M")
+
+def _render_html(ticker: str, sections: list[tuple[str, str]], price_history: "PriceHistory | None" = None) -> str:
+    """Render the HTML document from an already-parsed report.
+
+    Args:
+        ticker: Stock ticker symbol for the report header.
+        sections: List of (section_title, section_content) pairs from `_parse_markdown_report`.
+        price_history: Optional price history data for chart visualization.
+
+    Returns:
+        Complete HTML document as string.
+    """
+    # Extract recommendation summary and drop its line from the outlook body
+    recommendation_summary, sections = _extract_recommendation(sections)
+
+    # Generate price chart HTML (skip the whole chart path when there is no data)
+    price_chart_html = _generate_price_chart_html(price_history) if price_history and price_history.data else ""
+
+    # Section contexts stream lazily into the template loop: each section's markdown is
+    # converted as the template consumes it, and no pre-joined sections string exists.
+    section_contexts = (_section_context(title, content) for title, content in sections)
+
+    # Generate timestamp (only here, where the template actually needs it)
+    date_str, time_str = _now_strings()
 
     # Generate final HTML
-    html = HTML_TEMPLATE.format(
+    return _HTML_TMPL.render(
         ticker=ticker,
         date=date_str,
         time=time_str,
         recommendation_summary=recommendation_summary,
         price_chart=price_chart_html,
-        sections="\n".join(sections_html),
+        sections=section_contexts,
     )
 
-    return html
-
 
 def save_html_report(
     markdown_report: str,
@@ -994,8 +1096,8 @@ def save_html_report(
     Returns:
         Path to the saved HTML file.
     """
-    # Parse ticker for filename
-    ticker, _ = _parse_markdown_report(markdown_report)
+    # Parse once; the parsed sections are reused for rendering below
+    ticker, sections = _parse_markdown_report(markdown_report)
 
     # Setup output directory
     if output_dir is None:
@@ -1010,8 +1112,9 @@ def save_html_report(
     filename = f"{ticker}_analysis_{timestamp}.html"
     output_path = output_dir / filename
 
-    # Generate and save HTML
-    html_content = generate_html_report(markdown_report, price_history=price_history)
-    output_path.write_text(html_content, encoding="utf-8")
+    # Generate and save HTML (from the already-parsed sections, avoiding a second parse).
+    # Encode once and write the full buffer in one call rather than chunked text-codec writes.
+    html_content = _render_html(ticker, sections, price_history=price_history)
+    output_path.write_bytes(html_content.encode("utf-8"))
 
     return output_path
@@ -5,11 +5,14 @@ analysis is in progress, combining a Matrix-style rain background with a
 scrolling stock ticker tape and live agent status panel.
 """
 
-import random
+import functools
+import itertools
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, TypeVar
 
+import numpy as np
 import pyfiglet
 import yfinance as yf
 from asciimatics.screen import Screen
@@ -30,24 +33,55 @@ _AGENT_LABELS: list[tuple[AgentEnum, str]] = [
 ]
 
 
+@functools.lru_cache(maxsize=16)
+def _render_figlet(text: str, font: str) -> tuple[str, ...]:
+    """Render ASCII art text, memoized on (text, font).
+
+    pyfiglet loads and parses the font file on each figlet_format call, which is
+    tens of milliseconds of I/O and parsing — caching makes repeat constructions
+    a dict lookup.
+
+    Args:
+        text: Text to render.
+        font: Figlet font name.
+
+    Returns:
+        Tuple of non-empty rendered lines.
+    """
+    return tuple(ln for ln in pyfiglet.figlet_format(text, font=font).splitlines() if ln.strip())
+
+
+def _fetch_one_tape_entry(symbol: str) -> dict:
+    """Fetch the current price for a single tape ticker.
+
+    Args:
+        symbol: Stock ticker symbol.
+
+    Returns:
+        Dict with ticker, price, and change_pct (zeros on any failure).
+    """
+    try:
+        tk = yf.Ticker(symbol)
+        info = tk.fast_info
+        price = getattr(info, "last_price", None) or 0.0
+        prev = getattr(info, "previous_close", None) or price
+        change_pct = ((price - prev) / prev * 100) if prev else 0.0
+        return {"ticker": symbol, "price": price, "change_pct": change_pct}
+    except Exception:
+        return {"ticker": symbol, "price": 0.0, "change_pct": 0.0}
+
+
 def _fetch_tape_data() -> list[dict]:
     """Fetch current prices for popular tickers.
 
+    The per-symbol lookups are network-bound, so they fan out across a thread
+    pool instead of paying one round trip after another.
+
     Returns:
-        List of dicts with ticker, price, and change_pct.
+        List of dicts with ticker, price, and change_pct (in _TAPE_TICKERS order).
     """
-    tape: list[dict] = []
-    for symbol in _TAPE_TICKERS:
-        try:
-            tk = yf.Ticker(symbol)
-            info = tk.fast_info
-            price = getattr(info, "last_price", None) or 0.0
-            prev = getattr(info, "previous_close", None) or price
-            change_pct = ((price - prev) / prev * 100) if prev else 0.0
-            tape.append({"ticker": symbol, "price": price, "change_pct": change_pct})
-        except Exception:
-            tape.append({"ticker": symbol, "price": 0.0, "change_pct": 0.0})
-    return tape
+    with ThreadPoolExecutor(max_workers=len(_TAPE_TICKERS)) as executor:
+        return list(executor.map(_fetch_one_tape_entry, _TAPE_TICKERS))
 
 
 def _build_tape_string(tape_data: list[dict]) -> str:
@@ -59,36 +93,161 @@ def _build_tape_string(tape_data: list[dict]) -> str:
     Returns:
         Formatted ticker tape string.
     """
-    parts: list[str] = []
-    for item in tape_data:
-        sign = "+" if item["change_pct"] >= 0 else ""
-        parts.append(f"  {item['ticker']} ${item['price']:.2f} ({sign}{item['change_pct']:.1f}%)  ")
-    return " | ".join(parts) if parts else "  Loading market data...  "
+    if not tape_data:
+        return "  Loading market data...  "
+    return " | ".join(
+        f"  {item['ticker']} ${item['price']:.2f} ({'+' if item['change_pct'] >= 0 else ''}{item['change_pct']:.1f}%)  "
+        for item in tape_data
+    )
 
 
 # ---------------------------------------------------------------------------
 # Matrix rain state -- simple column-based falling characters
 # ---------------------------------------------------------------------------
+#
+# A numba @njit kernel for the advance/draw step was considered and rejected:
+# the JIT compile on first frame (even with cache=True, on a cold cache) costs
+# more than the animation's entire lifetime saves, and it would add a heavy
+# optional dependency for eye candy. The numpy SoA advance plus the batched
+# RNG pool below capture most of the win in plain Python.
 
 _MATRIX_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789@#$%&*"
 
+# Pre-seeded character pool indexed deterministically per cell. The rain only
+# needs visual randomness, so trading the per-frame RNG batch for a modular
+# lookup into 64K pre-drawn characters removes Python RNG from the hot path.
+_RAIN_POOL_SIZE = 1 << 16
+_RAIN_POOL_MASK = _RAIN_POOL_SIZE - 1
+_RAIN_CHAR_POOL = [_MATRIX_CHARS[i] for i in np.random.randint(0, len(_MATRIX_CHARS), size=_RAIN_POOL_SIZE).tolist()]
+
+
+class _MatrixRain:
+    """Structure-of-arrays state for every Matrix rain column.
 
-class _MatrixColumn:
-    """State for one column of the Matrix rain."""
+    Holds one ``pos``/``speed``/``length`` entry per screen column as numpy
+    int32 arrays so the per-frame advance is three vectorized operations
+    instead of a Python attribute dance per column.
+    """
 
-    def __init__(self, height: int) -> None:
+    def __init__(self, width: int, height: int) -> None:
         self.height = height
-        self.pos = random.randint(-height, 0)
-        self.speed = random.randint(1, 3)
-        self.length = random.randint(4, height // 2)
+        self.pos = np.random.randint(-height, 1, width).astype(np.int32)
+        self.speed = np.random.randint(1, 4, width).astype(np.int32)
+        self.length = np.random.randint(4, height // 2 + 1, width).astype(np.int32)
 
-    def advance(self) -> None:
-        """Move the rain drop down one step."""
+    def advance_all(self) -> None:
+        """Move every rain drop down one step, recycling drops past the bottom."""
         self.pos += self.speed
-        if self.pos - self.length > self.height:
-            self.pos = random.randint(-self.height // 2, 0)
-            self.speed = random.randint(1, 3)
-            self.length = random.randint(4, self.height // 2)
+        mask = self.pos - self.length > self.height
+        n = int(mask.sum())
+        if n:
+            self.pos[mask] = np.random.randint(-self.height // 2, 1, n)
+            self.speed[mask] = np.random.randint(1, 4, n)
+            self.length[mask] = np.random.randint(4, self.height // 2 + 1, n)
+
+
+# ---------------------------------------------------------------------------
+# Frame buffer -- double-buffered screen model, diffed per frame
+# ---------------------------------------------------------------------------
+
+
+class _FrameBuffer:
+    """Double-buffered character grid that only emits changed cells.
+
+    Draw helpers write (char, colour, attr) into the back buffer; :meth:`flush` diffs it
+    against what was last sent to the screen and issues one ``print_at`` per contiguous
+    same-style run of changed cells. Static regions (panel, figlet, status box) therefore
+    cost nothing after the frame that painted them.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self._chars = np.full((height, width), " ", dtype="<U1")
+        self._colours = np.zeros((height, width), dtype=np.int16)
+        self._attrs = np.zeros((height, width), dtype=np.int16)
+        # Sentinel chars in the front buffer force a full paint on the first flush
+        self._front_chars = np.full((height, width), "\x00", dtype="<U1")
+        self._front_colours = np.zeros((height, width), dtype=np.int16)
+        self._front_attrs = np.zeros((height, width), dtype=np.int16)
+
+    def clear(self) -> None:
+        """Reset the back buffer to blank cells."""
+        self._chars[:] = " "
+        self._colours[:] = Screen.COLOUR_BLACK
+        self._attrs[:] = Screen.A_NORMAL
+
+    def put(self, text: str, x: int, y: int, colour: int, attr: int = Screen.A_NORMAL) -> None:
+        """Write text into the back buffer at (x, y), clipped to the grid.
+
+        Args:
+            text: Characters to write.
+            x: Left x coordinate (may be negative; clipped).
+            y: Row coordinate (out-of-range rows are ignored).
+            colour: Screen colour constant.
+            attr: Screen attribute constant.
+        """
+        if not text or not 0 <= y < self.height or x >= self.width:
+            return
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        end = min(x + len(text), self.width)
+        if end <= x:
+            return
+        self._chars[y, x:end] = list(text[: end - x])
+        self._colours[y, x:end] = colour
+        self._attrs[y, x:end] = attr
+
+    def keep(self, x: int, y: int, w: int, h: int) -> None:
+        """Carry a rectangle over from the last flushed frame unchanged.
+
+        Lets the render loop skip redrawing a static region (e.g. the HUD
+        panel) while still clearing and redrawing everything around it.
+
+        Args:
+            x: Rectangle left x.
+            y: Rectangle top y.
+            w: Rectangle width.
+            h: Rectangle height.
+        """
+        x1, y1 = max(0, x), max(0, y)
+        x2, y2 = min(self.width, x + w), min(self.height, y + h)
+        if x2 <= x1 or y2 <= y1:
+            return
+        self._chars[y1:y2, x1:x2] = self._front_chars[y1:y2, x1:x2]
+        self._colours[y1:y2, x1:x2] = self._front_colours[y1:y2, x1:x2]
+        self._attrs[y1:y2, x1:x2] = self._front_attrs[y1:y2, x1:x2]
+
+    def flush(self, screen: Screen) -> None:
+        """Send cells that changed since the last flush to the screen.
+
+        Args:
+            screen: Asciimatics screen to draw on.
+        """
+        changed = (
+            (self._chars != self._front_chars)
+            | (self._colours != self._front_colours)
+            | (self._attrs != self._front_attrs)
+        )
+        for y in np.nonzero(changed.any(axis=1))[0].tolist():
+            row_chars = self._chars[y]
+            row_colours = self._colours[y]
+            row_attrs = self._attrs[y]
+            xs = np.nonzero(changed[y])[0].tolist()
+            start = prev = xs[0]
+            style = (int(row_colours[start]), int(row_attrs[start]))
+            for x in xs[1:]:
+                if x == prev + 1 and (int(row_colours[x]), int(row_attrs[x])) == style:
+                    prev = x
+                    continue
+                screen.print_at("".join(row_chars[start : prev + 1]), start, y, colour=style[0], attr=style[1])
+                start = prev = x
+                style = (int(row_colours[x]), int(row_attrs[x]))
+            screen.print_at("".join(row_chars[start : prev + 1]), start, y, colour=style[0], attr=style[1])
+        self._front_chars[:] = self._chars
+        self._front_colours[:] = self._colours
+        self._front_attrs[:] = self._attrs
 
 
 # ---------------------------------------------------------------------------
@@ -96,52 +255,76 @@ class _MatrixColumn:
 # ---------------------------------------------------------------------------
 
 
-def _draw_matrix(screen: Screen, columns: list[_MatrixColumn]) -> None:
+def _draw_matrix(buf: _FrameBuffer, rain: _MatrixRain, occluded: tuple[int, int, int, int] | None = None) -> None:
     """Draw one frame of Matrix rain.
 
+    Cells are composed into whole-row strings per style (green body, white bold head)
+    so each row costs one buffer write instead of one per character — asciimatics pays
+    wcwidth/attr overhead per call, which dominates per-cell drawing. Cells inside the
+    *occluded* rectangle (the HUD panel) are culled: the panel paints over them anyway,
+    so drawing them is pure waste. Column state still advances so motion is preserved.
+
     Args:
-        screen: Asciimatics screen.
-        columns: Per-column rain state.
+        buf: Frame buffer to draw into.
+        rain: Vectorized per-column rain state.
+        occluded: Optional (x1, y1, x2, y2) inclusive rectangle to skip.
     """
-    width = screen.width
-    height = screen.height
-    for x in range(min(width, len(columns))):
-        col = columns[x]
-        for dy in range(col.length):
-            y = col.pos - dy
-            if 2 <= y < height:
-                ch = random.choice(_MATRIX_CHARS)
-                brightness = Screen.COLOUR_GREEN if dy > 0 else Screen.COLOUR_WHITE
-                attr = Screen.A_BOLD if dy == 0 else Screen.A_NORMAL
-                try:
-                    screen.print_at(ch, x, y, colour=brightness, attr=attr)
-                except Exception:
-                    pass
-        col.advance()
-
-
-def _draw_ticker_tape(screen: Screen, tape: str, offset: int) -> None:
+    width = min(buf.width, len(rain.pos))
+    height = buf.height
+    pos = rain.pos.tolist()
+    lengths = rain.length.tolist()
+    ox1, oy1, ox2, oy2 = occluded if occluded is not None else (-1, -1, -1, -1)
+
+    # Cells index the pre-seeded pool by (position, column, depth); pos changes
+    # every frame, so the stream of characters still shimmers per frame without
+    # any RNG call in the hot path.
+    pool = _RAIN_CHAR_POOL
+    mask = _RAIN_POOL_MASK
+
+    body_rows: list[list[str]] = [[" "] * width for _ in range(height)]
+    heads: list[tuple[int, int, str]] = []
+    for x in range(width):
+        p = pos[x]
+        base = p * 131 + x * 113
+        col_occluded = ox1 <= x <= ox2
+        for dy in range(lengths[x]):
+            y = p - dy
+            if 2 <= y < height and not (col_occluded and oy1 <= y <= oy2):
+                ch = pool[(base + dy) & mask]
+                if dy == 0:
+                    heads.append((x, y, ch))
+                else:
+                    body_rows[y][x] = ch
+
+    blank_row = " " * width
+    for y in range(2, height):
+        line = "".join(body_rows[y])
+        if line != blank_row:
+            buf.put(line, 0, y, colour=Screen.COLOUR_GREEN, attr=Screen.A_NORMAL)
+    for x, y, ch in heads:
+        buf.put(ch, x, y, colour=Screen.COLOUR_WHITE, attr=Screen.A_BOLD)
+    rain.advance_all()
+
+
+def _draw_ticker_tape(buf: _FrameBuffer, tape: str, offset: int) -> None:
     """Draw the scrolling ticker tape on row 0.
 
     Args:
-        screen: Asciimatics screen.
+        buf: Frame buffer to draw into.
         tape: Double-length tape string for seamless wrapping.
         offset: Current scroll offset.
     """
-    width = screen.width
+    width = buf.width
     half = len(tape) // 2
-    for i in range(width):
-        idx = (offset + i) % half
-        ch = tape[idx] if idx < len(tape) else " "
-        try:
-            screen.print_at(ch, i, 0, colour=Screen.COLOUR_CYAN, attr=Screen.A_BOLD)
-        except Exception:
-            pass
+    # The tape is doubled for seamless wrap, so a single slice always covers
+    # the row; top up from the start if the screen is wider than the tape.
+    start = offset % half if half else 0
+    segment = tape[start : start + width]
+    while len(segment) < width:
+        segment += tape[: width - len(segment)] or " " * (width - len(segment))
+    buf.put(segment[:width], 0, 0, colour=Screen.COLOUR_CYAN, attr=Screen.A_BOLD)
     # Separator line
-    try:
-        screen.print_at("\u2500" * width, 0, 1, colour=Screen.COLOUR_GREEN)
-    except Exception:
-        pass
+    buf.put("\u2500" * width, 0, 1, colour=Screen.COLOUR_GREEN)
 
 
 def _compute_panel_geometry(
@@ -179,80 +362,109 @@ def _compute_panel_geometry(
     return panel_x, panel_y, panel_w, panel_h, figlet_start_y, figlet_base_x
 
 
-def _draw_panel_bg(screen: Screen, px: int, py: int, pw: int, ph: int) -> None:
-    """Draw a dark background panel with a subtle border for the HUD overlay.
+def _panel_strings(buf: _FrameBuffer, px: int, py: int, pw: int, ph: int) -> tuple[int, int, int, int, list[str]]:
+    """Clamp the panel rectangle to the screen and prebuild its full rows.
 
-    Clears a rectangular region and draws a thin border, giving the
-    figlet + status box a readable dark backdrop while rain fills the rest.
+    Every panel row — top border, bordered blank interior rows, bottom
+    border — is the same every frame, so the complete strings are built once
+    per geometry and drawing collapses to one buffer write per row.
 
     Args:
-        screen: Asciimatics screen.
+        buf: Frame buffer (for screen bounds).
         px: Panel top-left x.
         py: Panel top-left y.
         pw: Panel width.
         ph: Panel height.
+
+    Returns:
+        (x1, y1, x2, y2, row_strings)
     """
-    width = screen.width
-    height = screen.height
-    # Clamp to screen
     x1 = max(0, px)
     y1 = max(2, py)
-    x2 = min(width - 1, px + pw - 1)
-    y2 = min(height - 1, py + ph - 1)
+    x2 = min(buf.width - 1, px + pw - 1)
+    y2 = min(buf.height - 1, py + ph - 1)
+    inner = max(0, x2 - x1 - 1)
+    rows = (
+        ["\u250c" + "\u2500" * inner + "\u2510"]
+        + ["\u2502" + " " * inner + "\u2502"] * max(0, y2 - y1 - 1)
+        + ["\u2514" + "\u2500" * inner + "\u2518"]
+    )
+    return x1, y1, x2, y2, rows
+
+
+def _draw_panel_bg(buf: _FrameBuffer, rect: tuple[int, int, int, int, list[str]]) -> None:
+    """Draw a dark background panel with a subtle border for the HUD overlay.
 
-    # Fill interior with spaces (black background)
-    blank = " " * (x2 - x1 + 1)
-    for y in range(y1, y2 + 1):
-        try:
-            screen.print_at(blank, x1, y, colour=Screen.COLOUR_BLACK)
-        except Exception:
-            pass
+    Clears a rectangular region and draws a thin border, giving the
+    figlet + status box a readable dark backdrop while rain fills the rest.
+
+    Args:
+        buf: Frame buffer to draw into.
+        rect: Precomputed geometry and row strings from :func:`_panel_strings`.
+    """
+    x1, y1, _, _, rows = rect
+    for i, row in enumerate(rows):
+        buf.put(row, x1, y1 + i, colour=Screen.COLOUR_GREEN, attr=Screen.A_NORMAL)
 
-    # Draw subtle border
-    h_bar = "\u2500" * (x2 - x1 - 1)
-    try:
-        screen.print_at("\u250c" + h_bar + "\u2510", x1, y1, colour=Screen.COLOUR_GREEN, attr=Screen.A_NORMAL)
-        screen.print_at("\u2514" + h_bar + "\u2518", x1, y2, colour=Screen.COLOUR_GREEN, attr=Screen.A_NORMAL)
-    except Exception:
-        pass
-    for y in range(y1 + 1, y2):
-        try:
-            screen.print_at("\u2502", x1, y, colour=Screen.COLOUR_GREEN, attr=Screen.A_NORMAL)
-            screen.print_at("\u2502", x2, y, colour=Screen.COLOUR_GREEN, attr=Screen.A_NORMAL)
-        except Exception:
-            pass
 
+def _draw_figlet(buf: _FrameBuffer, rows: list[tuple[int, str]], base_x: int) -> None:
+    """Draw pyfiglet ASCII art from precomputed (row, line) pairs.
 
-def _draw_figlet(screen: Screen, lines: list[str], base_x: int, start_y: int) -> int:
-    """Draw pyfiglet ASCII art at specified position.
+    The lines are stripped, clipped to screen width, and filtered to visible
+    rows once at geometry time, so this is a flat loop of buffer writes.
 
     Args:
-        screen: Asciimatics screen.
-        lines: Figlet text split into lines.
+        buf: Frame buffer to draw into.
+        rows: (y, line) pairs for every visible figlet line.
         base_x: Left x coordinate for drawing.
-        start_y: Top y coordinate for drawing.
+    """
+    for y, line in rows:
+        buf.put(line, base_x, y, colour=Screen.COLOUR_CYAN, attr=Screen.A_BOLD)
+
+
+_SPINNER = ["|", "/", "-", "\\"]
+
+
+def _build_status_row_table() -> dict[tuple[int, StatusEnum, str], tuple[str, int]]:
+    """Prebuild every possible agent status row string.
+
+    The rows are drawn from small closed sets — 6 agents x 4 statuses x the
+    spinner frames (plus the completion check mark) — so all of them are
+    formatted once at import and the per-frame work collapses to dict lookups.
 
     Returns:
-        Y position after the last figlet line.
+        Mapping of (agent_index, status, spinner_char) to (row_string, colour).
     """
-    width = screen.width
-    height = screen.height
-
-    for i, line in enumerate(lines):
-        y = start_y + i
-        if 2 <= y < height - 1:
-            stripped = line.rstrip()
-            if len(stripped) >= width:
-                stripped = stripped[: width - 1]
-            try:
-                screen.print_at(stripped, base_x, y, colour=Screen.COLOUR_CYAN, attr=Screen.A_BOLD)
-            except Exception:
-                pass
-    return start_y + len(lines)
+    box_w = 38
+    label_pad = 14  # fixed column width for agent names
+    table: dict[tuple[int, StatusEnum, str], tuple[str, int]] = {}
+    for idx, (_, label) in enumerate(_AGENT_LABELS):
+        for status in StatusEnum:
+            for spinner_char in [*_SPINNER, "\u2713"]:
+                if status == StatusEnum.RUNNING:
+                    status_text = f" {spinner_char} RUNNING"
+                    colour = Screen.COLOUR_YELLOW
+                elif status == StatusEnum.DONE:
+                    status_text = " \u2713 DONE   "
+                    colour = Screen.COLOUR_GREEN
+                elif status == StatusEnum.SKIPPED:
+                    status_text = " \u2013 SKIP   "
+                    colour = Screen.COLOUR_MAGENTA
+                else:
+                    status_text = " \u00b7 WAIT   "
+                    colour = Screen.COLOUR_WHITE
+                # "│ " (2) + label_pad (14) + dots + status_text + " │" (2) = box_w
+                label_part = f"\u2502 {label:<{label_pad}}"
+                dots_len = max(0, box_w - 2 - label_pad - len(status_text) - 2)
+                table[(idx, status, spinner_char)] = (f"{label_part}{'.' * dots_len}{status_text} \u2502", colour)
+    return table
+
+
+_STATUS_ROW_TABLE = _build_status_row_table()
 
 
 def _draw_status_box(
-    screen: Screen,
+    buf: _FrameBuffer,
     top_y: int,
     status_dict: dict[AgentEnum, StatusEnum],
     spinner_char: str,
@@ -261,14 +473,14 @@ def _draw_status_box(
     """Draw the agent status box.
 
     Args:
-        screen: Asciimatics screen.
+        buf: Frame buffer to draw into.
         top_y: Y position for the top of the box.
         status_dict: Agent enum -> status enum mapping.
         spinner_char: Current spinner frame character.
         is_complete: Whether analysis is complete.
     """
-    width = screen.width
-    height = screen.height
+    width = buf.width
+    height = buf.height
     box_w = 38
     box_x = max(0, (width - box_w) // 2)
     box_y = top_y + 2
@@ -279,47 +491,22 @@ def _draw_status_box(
     border_top = "\u250c" + "\u2500" * left_pad + title
     border_top += "\u2500" * (box_w - 1 - len(border_top)) + "\u2510"
     if box_y < height - 1:
-        try:
-            screen.print_at(border_top, box_x, box_y, colour=Screen.COLOUR_GREEN)
-        except Exception:
-            pass
+        buf.put(border_top, box_x, box_y, colour=Screen.COLOUR_GREEN)
 
-    # Agent rows
-    _LABEL_PAD = 14  # fixed column width for agent names
-    for idx, (key, label) in enumerate(_AGENT_LABELS):
+    # Agent rows -- every possible row string is prebuilt in _STATUS_ROW_TABLE
+    for idx, (key, _) in enumerate(_AGENT_LABELS):
         row_y = box_y + 1 + idx
         if row_y >= height - 1:
             break
         status = status_dict.get(key, StatusEnum.WAIT)
-        if status == StatusEnum.RUNNING:
-            status_text = f" {spinner_char} RUNNING"
-            colour = Screen.COLOUR_YELLOW
-        elif status == StatusEnum.DONE:
-            status_text = " \u2713 DONE   "
-            colour = Screen.COLOUR_GREEN
-        elif status == StatusEnum.SKIPPED:
-            status_text = " \u2013 SKIP   "
-            colour = Screen.COLOUR_MAGENTA
-        else:
-            status_text = " \u00b7 WAIT   "
-            colour = Screen.COLOUR_WHITE
-        # "│ " (2) + label_pad (14) + dots + status_text + " │" (2) = box_w
-        label_part = f"\u2502 {label:<{_LABEL_PAD}}"
-        dots_len = max(0, box_w - 2 - _LABEL_PAD - len(status_text) - 2)
-        line = f"{label_part}{'.' * dots_len}{status_text} \u2502"
-        try:
-            screen.print_at(line, box_x, row_y, colour=colour)
-        except Exception:
-            pass
+        line, colour = _STATUS_ROW_TABLE[(idx, status, spinner_char)]
+        buf.put(line, box_x, row_y, colour=colour)
 
     # Bottom border
     bot_y = box_y + 1 + len(_AGENT_LABELS)
     if bot_y < height - 1:
         border_bot = "\u2514" + "\u2500" * (box_w - 2) + "\u2518"
-        try:
-            screen.print_at(border_bot, box_x, bot_y, colour=Screen.COLOUR_GREEN)
-        except Exception:
-            pass
+        buf.put(border_bot, box_x, bot_y, colour=Screen.COLOUR_GREEN)
 
     # Status message
     msg_y = bot_y + 2
@@ -331,17 +518,13 @@ def _draw_status_box(
             msg = f"  {spinner_char} Analyzing...  "
             colour = Screen.COLOUR_CYAN
         msg_x = max(0, (width - len(msg)) // 2)
-        try:
-            screen.print_at(msg, msg_x, msg_y, colour=colour, attr=Screen.A_BOLD)
-        except Exception:
-            pass
+        buf.put(msg, msg_x, msg_y, colour=colour, attr=Screen.A_BOLD)
 
 
 # ---------------------------------------------------------------------------
 # PlayAnimation -- the public API
 # ---------------------------------------------------------------------------
 
-_SPINNER = ["|", "/", "-", "\\"]
 _T = TypeVar("_T")
 
 
@@ -369,11 +552,13 @@ class PlayAnimation:
         raw_tape = _build_tape_string(tape_data or [])
         self._tape = raw_tape + "   " + raw_tape  # doubled for wrap
         self._status: dict[AgentEnum, StatusEnum] = {key: StatusEnum.WAIT for key, _ in _AGENT_LABELS}
+        self._status_lock = threading.Lock()
+        self._status_version = 0
+        self._spinner_cycle = itertools.cycle(_SPINNER)
+        self._spinner_char = next(self._spinner_cycle)
         self._stop_event = threading.Event()
         self._failed = False
-        self._figlet_lines = [
-            ln for ln in pyfiglet.figlet_format("ThinkOnlyOnce", font="small").splitlines() if ln.strip()
-        ]
+        self._figlet_lines = list(_render_figlet("ThinkOnlyOnce", "small"))
 
         # Populated by run() / _render_loop
         self._analysis_fn: Callable[[], Any] | None = None
@@ -381,13 +566,18 @@ class PlayAnimation:
         self._analysis_error: BaseException | None = None
 
     def update_status(self, agent: AgentEnum, status: StatusEnum) -> None:
-        """Update an agent's status (thread-safe via dict assignment).
+        """Update an agent's status and bump the render version counter.
+
+        The lock makes the dict write and version bump visible as a unit, so
+        the render thread never repaints from a half-applied update.
 
         Args:
             agent: Agent identifier enum value.
             status: Status enum value.
         """
-        self._status[agent] = status
+        with self._status_lock:
+            self._status[agent] = status
+            self._status_version += 1
 
     @property
     def failed(self) -> bool:
@@ -434,15 +624,44 @@ class PlayAnimation:
         Args:
             screen: Asciimatics screen provided by Screen.wrapper.
         """
-        # Build matrix rain columns
-        columns = [_MatrixColumn(screen.height) for _ in range(screen.width)]
+        # Build matrix rain state and the diffing frame buffer
+        rain = _MatrixRain(screen.width, screen.height)
+        buf = _FrameBuffer(screen.width, screen.height)
         tape_offset = 0
         frame = 0
 
-        # Pre-compute the floating HUD panel geometry
+        # Pre-compute the floating HUD panel geometry and per-frame constants:
+        # the panel's blank/border row strings and the stripped, width-clipped
+        # figlet lines never change for a given screen size.
         px, py, pw, ph, fig_y, fig_x = _compute_panel_geometry(
             screen.width, screen.height, self._figlet_lines,
         )
+        panel_rect = _panel_strings(buf, px, py, pw, ph)
+        panel_occlusion = panel_rect[:4]
+        figlet_rows = [
+            (fig_y + i, ln.rstrip()[: screen.width - 1])
+            for i, ln in enumerate(self._figlet_lines)
+            if 2 <= fig_y + i < screen.height - 1
+        ]
+        figlet_end = fig_y + len(self._figlet_lines)
+
+        def _compose_frame(spinner_char: str, is_complete: bool) -> None:
+            """Compose one full frame (all layers, in draw order) into the buffer.
+
+            The _FrameBuffer already turns composition into a single run-length
+            emission at flush time; keeping the layer sequence in one place means
+            both the live loop and the completion sequence share it.
+
+            Args:
+                spinner_char: Spinner frame to show in the status box.
+                is_complete: Whether to render the completion message.
+            """
+            buf.clear()
+            _draw_matrix(buf, rain, panel_occlusion)
+            _draw_ticker_tape(buf, self._tape, tape_offset)
+            _draw_panel_bg(buf, panel_rect)
+            _draw_figlet(buf, figlet_rows, fig_x)
+            _draw_status_box(buf, figlet_end, self._status, spinner_char, is_complete)
 
         # --- launch analysis in a background thread ---
         def _worker() -> None:
@@ -460,17 +679,24 @@ class PlayAnimation:
         worker = threading.Thread(target=_worker, daemon=True)
         worker.start()
 
+        # Drift-corrected 20fps scheduler: each frame sleeps until an absolute
+        # monotonic deadline instead of a fixed 50ms after drawing, so the frame
+        # period stays at 50ms regardless of how long drawing took.
+        _FRAME_PERIOD = 0.05
+        deadline = time.monotonic()
+
+        # Most frames only animate the rain and tape; the HUD panel is repainted
+        # only when an agent status changed or 200ms passed (spinner cadence).
+        last_status_version = -1
+        last_panel_frame = 0.0
+
         while True:
             # Check for stop
             if self._stop_event.is_set():
                 # Show "COMPLETE" for ~1 second then exit
                 for _ in range(20):
-                    screen.clear_buffer(Screen.COLOUR_BLACK, Screen.A_NORMAL, Screen.COLOUR_BLACK)
-                    _draw_matrix(screen, columns)
-                    _draw_ticker_tape(screen, self._tape, tape_offset)
-                    _draw_panel_bg(screen, px, py, pw, ph)
-                    figlet_end = _draw_figlet(screen, self._figlet_lines, fig_x, fig_y)
-                    _draw_status_box(screen, figlet_end, self._status, "\u2713", True)
+                    _compose_frame("\u2713", True)
+                    buf.flush(screen)
                     screen.refresh()
                     time.sleep(0.05)
                     frame += 1
@@ -479,13 +705,23 @@ class PlayAnimation:
 
             # Normal frame
             try:
-                screen.clear_buffer(Screen.COLOUR_BLACK, Screen.A_NORMAL, Screen.COLOUR_BLACK)
-                _draw_matrix(screen, columns)
-                _draw_ticker_tape(screen, self._tape, tape_offset)
-                _draw_panel_bg(screen, px, py, pw, ph)
-                figlet_end = _draw_figlet(screen, self._figlet_lines, fig_x, fig_y)
-                spinner = _SPINNER[(frame // 5) % len(_SPINNER)]
-                _draw_status_box(screen, figlet_end, self._status, spinner, False)
+                now = time.monotonic()
+                with self._status_lock:
+                    version = self._status_version
+                if version != last_status_version or now - last_panel_frame >= 0.2:
+                    if frame % 5 == 0:
+                        self._spinner_char = next(self._spinner_cycle)
+                    _compose_frame(self._spinner_char, False)
+                    last_status_version = version
+                    last_panel_frame = now
+                else:
+                    # Animation-only frame: redraw the moving layers and carry
+                    # the panel rectangle over unchanged.
+                    buf.clear()
+                    _draw_matrix(buf, rain, panel_occlusion)
+                    _draw_ticker_tape(buf, self._tape, tape_offset)
+                    buf.keep(px, py, pw, ph)
+                buf.flush(screen)
                 screen.refresh()
             except Exception:
                 break
@@ -494,25 +730,32 @@ class PlayAnimation:
             if frame % 2 == 0:
                 tape_offset += 1
 
-            time.sleep(0.05)  # ~20 fps
+            if self._stop_event.is_set():
+                continue  # start the completion sequence immediately
+            deadline += _FRAME_PERIOD
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                # Severe overrun (e.g. suspended terminal): re-anchor instead
+                # of sprinting through the missed frames.
+                deadline = time.monotonic()
 
         # Wait for analysis thread to finish before Screen.wrapper restores terminal
         worker.join(timeout=5)
 
 
-def fetch_tape_data_async() -> tuple[Callable[[], list[dict]], threading.Thread]:
-    """Start fetching ticker tape data in a background thread.
+# Shared pool for tape fetches -- avoids spawning a fresh thread per call
+_TAPE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tape")
 
-    Returns:
-        A tuple of (getter_function, thread). Call the getter after
-        thread.join() to retrieve the results.
-    """
-    result: list[dict] = []
 
-    def _fetch() -> None:
-        nonlocal result
-        result = _fetch_tape_data()
+def fetch_tape_data_async() -> "tuple[Callable[[], list[dict]], Future[list[dict]]]":
+    """Start fetching ticker tape data on the shared background pool.
 
-    thread = threading.Thread(target=_fetch, daemon=True)
-    thread.start()
-    return lambda: result, thread
+    Returns:
+        A tuple of (getter_function, future). Wait on the future, then call
+        the getter to retrieve the results; the getter returns an empty list
+        if the fetch has not finished.
+    """
+    future: Future[list[dict]] = _TAPE_EXECUTOR.submit(_fetch_tape_data)
+    return (lambda: future.result(timeout=0) if future.done() else []), future
@@ -4,10 +4,16 @@ from think_only_once.prompts.registry import (
     PromptSpec,
     get_prompt_spec,
     get_prompt_text,
+    get_prompt_texts,
+    render_investment_batch,
+    render_prompt,
 )
 
 __all__ = [
     "PromptSpec",
     "get_prompt_spec",
     "get_prompt_text",
+    "get_prompt_texts",
+    "render_investment_batch",
+    "render_prompt",
 ]
@@ -1,20 +1,24 @@
 """Prompt registry with version pinning.
 
-This module provides a minimal, code-first prompt registry:
-- Prompts are stored in-code with explicit semantic versions.
+This module provides a minimal prompt registry:
+- Prompt bodies live as markdown resources under `prompts/texts/{agent}/{version}.md`.
 - Active versions are pinned in `config.yaml` via `prompts.versions`.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import string
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
+from importlib import resources
+from typing import NamedTuple
 
 from think_only_once.config.settings import get_settings
 from think_only_once.enums import AgentEnum
 
 
-@dataclass(frozen=True, slots=True)
-class PromptSpec:
+class PromptSpec(NamedTuple):
     """A versioned prompt definition."""
 
     prompt_id: AgentEnum
@@ -22,453 +26,134 @@ class PromptSpec:
     text: str
 
 
-def _registry() -> dict[AgentEnum, dict[str, PromptSpec]]:
-    """Return the in-code prompt registry.
+@lru_cache(maxsize=16)
+def _load_text(agent: str, version: str) -> str:
+    """Read one prompt body from its markdown resource, at most once per process.
+
+    Keeping the multi-kilobyte texts out of the module source means importing
+    the registry parses no large literals and text fixes are a file swap
+    rather than a code change.
+
+    Args:
+        agent: Agent enum value (directory name under ``texts/``).
+        version: Prompt version (file stem).
+
+    Returns:
+        Prompt text.
+    """
+    return (resources.files("think_only_once.prompts") / "texts" / agent / f"{version}.md").read_text("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _registry() -> dict[tuple[AgentEnum, str], PromptSpec]:
+    """Return the prompt registry, built once per process.
+
+    The mapping is flat — one tuple-keyed probe per lookup instead of two
+    chained dict probes.
 
     Notes:
         - Keep the *current behavior* as version 1.0.0.
         - Add new versions without deleting old ones.
 
     Returns:
-        Mapping of agent enum -> version -> prompt spec.
+        Mapping of (agent enum, version) -> prompt spec.
     """
-    # NOTE: These 1.0.0 prompts mirror the original prompts as implemented in the agents.
-    return {
-        AgentEnum.TECHNICAL_ANALYST: {
-            "1.0.0": PromptSpec(
-                prompt_id=AgentEnum.TECHNICAL_ANALYST,
-                version="1.0.0",
-                text=(
-                    "You are a Technical Analyst specializing in stock price analysis.\n\n"
-                    "Your task is to analyze the technical indicators for a given stock and provide insights.\n\n"
-                    "Focus on:\n"
-                    "1. Price trend (bullish/bearish/neutral)\n"
-                    "2. Support and resistance levels\n"
-                    "3. Moving average signals (golden cross, death cross)\n"
-                    "4. Volume analysis\n"
-                    "5. Short-term price outlook\n\n"
-                    "Be concise and actionable in your analysis.\n"
-                ),
-            ),
-            "1.1.0": PromptSpec(
-                prompt_id=AgentEnum.TECHNICAL_ANALYST,
-                version="1.1.0",
-                text=(
-                    "You are a Technical Analyst. Your job is to turn the provided technical data into a clear, "
-                    "auditable read of trend and risk.\n\n"
-                    "Data discipline:\n"
-                    "- Use ONLY values explicitly provided by tools or the user.\n"
-                    "- If a value is missing, write 'Not available' (do not estimate).\n"
-                    "- Do not invent indicators (e.g., RSI/MACD) unless they are provided.\n\n"
-                    "Focus on the available signals:\n"
-                    "- Price vs 50D MA and 200D MA\n"
-                    "- 52-week range positioning (distance to 52W high/low)\n"
-                    "- Volume vs average volume\n\n"
-                    "Heuristics (sector/regime can change relevance):\n"
-                    "- Price above both 50D and 200D: bullish trend bias; below both: bearish bias.\n"
-                    "- 50D above 200D: constructive trend; 50D below 200D: cautious trend.\n"
-                    "- Volume significantly above average during a move: stronger confirmation than a low-volume move.\n\n"
-                    "Output format:\n"
-                    "### Facts\n"
-                    "- Current price: ...\n"
-                    "- 50D MA / 200D MA: ... / ...\n"
-                    "- 52W high / 52W low: ... / ...\n"
-                    "- Volume / Avg volume: ... / ...\n\n"
-                    "### Interpretation\n"
-                    "- Trend: BULLISH / BEARISH / NEUTRAL (explain using 2-3 concrete facts)\n"
-                    "- Momentum/positioning: where price sits in the 52W range\n"
-                    "- Volume confirmation: confirm / not confirm / not available\n\n"
-                    "### Key Levels (proxied by available data)\n"
-                    "- Potential supports: 200D MA, 50D MA, 52W low (if available)\n"
-                    "- Potential resistances: 50D/200D MA if above price, 52W high (if available)\n\n"
-                    "### Actionable Takeaways\n"
-                    "- 2-4 bullets: what would confirm the view, what would invalidate it, and one risk note.\n"
-                ),
-            ),
-            "1.1.1": PromptSpec(
-                prompt_id=AgentEnum.TECHNICAL_ANALYST,
-                version="1.1.1",
-                text=(
-                    "You are a Technical Analyst. Your job is to turn the provided technical data into a clear, "
-                    "auditable read of trend and risk.\n\n"
-                    "Data discipline:\n"
-                    "- Use ONLY values explicitly provided by tools or the user.\n"
-                    "- If a value is missing, write 'Not available' (do not estimate).\n"
-                    "- Do not invent indicators (e.g., RSI/MACD) unless they are provided.\n\n"
-                    "Focus on the available signals:\n"
-                    "- Price vs 50D MA and 200D MA\n"
-                    "- 52-week range positioning (distance to 52W high/low)\n"
-                    "- Volume vs average volume\n\n"
-                    "Heuristics (sector/regime can change relevance):\n"
-                    "- Price above both 50D and 200D: bullish trend bias; below both: bearish bias.\n"
-                    "- 50D above 200D: constructive trend; 50D below 200D: cautious trend.\n"
-                    "- Volume significantly above average during a move: stronger confirmation than a low-volume move.\n\n"
-                    "Output format:\n"
-                    "### Facts\n"
-                    "- Current price: ...\n"
-                    "- 50D MA / 200D MA: ... / ...\n"
-                    "- 52W high / 52W low: ... / ...\n"
-                    "- Volume / Avg volume: ... / ...\n\n"
-                    "### Interpretation\n"
-                    "- Trend: BULLISH / BEARISH / NEUTRAL (explain using 2-3 concrete facts)\n"
-                    "- Momentum/positioning: where price sits in the 52W range\n"
-                    "- Volume confirmation: confirm / not confirm / not available\n\n"
-                    "### Key Levels (proxied by available data)\n"
-                    "- Potential supports: 200D MA, 50D MA, 52W low (if available)\n"
-                    "- Potential resistances: 50D/200D MA if above price, 52W high (if available)\n\n"
-                    "### Actionable Takeaways\n"
-                    "- 2-4 bullets: what would confirm the view, what would invalidate it, and one risk note.\n"
-                ),
-            ),
-        },
-        AgentEnum.FUNDAMENTAL_ANALYST: {
-            "1.0.0": PromptSpec(
-                prompt_id=AgentEnum.FUNDAMENTAL_ANALYST,
-                version="1.0.0",
-                text=(
-                    "You are a Fundamental Analyst specializing in company valuation.\n\n"
-                    "Your task is to analyze the financial health and valuation of a given stock.\n\n"
-                    "Focus on:\n"
-                    "1. Valuation metrics (P/E ratio, forward P/E)\n"
-                    "2. Profitability (margins, EPS)\n"
-                    "3. Growth potential\n"
-                    "4. Financial health (debt levels)\n"
-                    "5. Investment thesis\n\n"
-                    "Be concise and actionable in your analysis.\n"
-                ),
-            ),
-            "1.1.0": PromptSpec(
-                prompt_id=AgentEnum.FUNDAMENTAL_ANALYST,
-                version="1.1.0",
-                text=(
-                    "You are a Fundamental Analyst. Your job is to evaluate valuation and balance-sheet risk using "
-                    "ONLY the provided fundamentals.\n\n"
-                    "Data discipline:\n"
-                    "- Use ONLY values explicitly provided by tools or the user.\n"
-                    "- If a value is missing, write 'Not available' (do not estimate).\n"
-                    "- Avoid absolute claims without sector context; label thresholds as heuristics.\n\n"
-                    "What to cover (only if data exists):\n"
-                    "- Valuation: trailing P/E vs forward P/E (direction matters)\n"
-                    "- Profitability: profit margin, EPS\n"
-                    "- Scale: revenue, market cap\n"
-                    "- Balance sheet risk: debt-to-equity\n"
-                    "- Shareholder return: dividend yield\n"
-                    "- Context: sector/industry if provided\n\n"
-                    "Heuristics (NOT universal, sector matters):\n"
-                    "- Forward P/E < trailing P/E: market expects earnings growth; forward > trailing: expects slowdown.\n"
-                    "- Higher debt-to-equity generally increases downside risk and sensitivity to rates.\n\n"
-                    "Output format:\n"
-                    "### Facts\n"
-                    "- Market cap: ...\n"
-                    "- P/E (trailing) / P/E (forward): ... / ...\n"
-                    "- Revenue: ...\n"
-                    "- EPS: ...\n"
-                    "- Profit margin: ...\n"
-                    "- Debt-to-equity: ...\n"
-                    "- Dividend yield: ...\n"
-                    "- Sector / Industry: ... / ...\n\n"
-                    "### Interpretation\n"
-                    "- Valuation stance: CHEAP / FAIR / RICH (relative, explain why using provided metrics)\n"
-                    "- Financial health: LOW / MEDIUM / HIGH balance-sheet risk (explain with debt-to-equity and profitability)\n"
-                    "- Quality/growth signals: what the forward vs trailing multiple implies, if available\n\n"
-                    "### Actionable Takeaways\n"
-                    "- 2-4 bullets: key fundamental strengths, key weaknesses, and what metric would change your view.\n"
-                ),
-            ),
-            "1.1.1": PromptSpec(
-                prompt_id=AgentEnum.FUNDAMENTAL_ANALYST,
-                version="1.1.1",
-                text=(
-                    "You are a Fundamental Analyst. Your job is to evaluate valuation and balance-sheet risk using "
-                    "ONLY the provided fundamentals.\n\n"
-                    "Data discipline:\n"
-                    "- Use ONLY values explicitly provided by tools or the user.\n"
-                    "- If a value is missing, write 'Not available' (do not estimate).\n"
-                    "- Avoid absolute claims without sector context; label thresholds as heuristics.\n\n"
-                    "What to cover (only if data exists):\n"
-                    "- Valuation: trailing P/E vs forward P/E (direction matters)\n"
-                    "- Profitability: profit margin, EPS\n"
-                    "- Scale: revenue, market cap\n"
-                    "- Balance sheet risk: debt-to-equity\n"
-                    "- Shareholder return: dividend yield\n"
-                    "- Context: sector/industry if provided\n\n"
-                    "Heuristics (NOT universal, sector matters):\n"
-                    "- Forward P/E < trailing P/E: market expects earnings growth; forward > trailing: expects slowdown.\n"
-                    "- Higher debt-to-equity generally increases downside risk and sensitivity to rates.\n\n"
-                    "Output format:\n"
-                    "### Facts\n"
-                    "- Market cap: ...\n"
-                    "- P/E (trailing) / P/E (forward): ... / ...\n"
-                    "- Revenue: ...\n"
-                    "- EPS: ...\n"
-                    "- Profit margin: ...\n"
-                    "- Debt-to-equity: ...\n"
-                    "- Dividend yield: ...\n"
-                    "- Sector / Industry: ... / ...\n\n"
-                    "### Interpretation\n"
-                    "- Valuation stance: CHEAP / FAIR / RICH (relative, explain why using provided metrics)\n"
-                    "- Financial health: LOW / MEDIUM / HIGH balance-sheet risk (explain with debt-to-equity and profitability)\n"
-                    "- Quality/growth signals: what the forward vs trailing multiple implies, if available\n\n"
-                    "### Actionable Takeaways\n"
-                    "- 2-4 bullets: key fundamental strengths, key weaknesses, and what metric would change your view.\n"
-                ),
-            ),
-        },
-        AgentEnum.NEWS_ANALYST: {
-            "1.0.0": PromptSpec(
-                prompt_id=AgentEnum.NEWS_ANALYST,
-                version="1.0.0",
-                text=(
-                    "You are a News Analyst specializing in market sentiment.\n\n"
-                    "Your task is to analyze recent news about a stock and assess market sentiment.\n\n"
-                    "Focus on:\n"
-                    "1. Overall sentiment (positive/negative/neutral/mixed)\n"
-                    "2. Key headlines and their impact\n"
-                    "3. Emerging themes or trends\n"
-                    "4. Potential catalysts or risks\n"
-                    "5. News-driven price outlook\n\n"
-                    "Be concise and actionable in your analysis.\n"
-                ),
-            ),
-            "1.1.0": PromptSpec(
-                prompt_id=AgentEnum.NEWS_ANALYST,
-                version="1.1.0",
-                text=(
-                    "You are a News & Sentiment Analyst. Your job is to summarize what the provided "
-                    "headlines/snippets imply for sentiment and near-term risk.\n\n"
-                    "Data discipline:\n"
-                    "- Use ONLY the headlines/snippets provided by tools or the user.\n"
-                    "- If dates/sources are not provided, say so (do not guess recency).\n"
-                    "- Do not fabricate events, numbers, or quotes.\n\n"
-                    "Sentiment labels:\n"
-                    "- POSITIVE: clear favorable catalyst or constructive tone\n"
-                    "- NEGATIVE: clear adverse catalyst or damaging tone\n"
-                    "- MIXED: meaningful positives and negatives present\n"
-                    "- NEUTRAL: informational/no clear directional impact\n\n"
-                    "Output format:\n"
-                    "### Facts\n"
-                    "- Top headlines (3-6 bullets):\n"
-                    "  - ...\n\n"
-                    "### Interpretation\n"
-                    "- Overall sentiment: POSITIVE / NEGATIVE / MIXED / NEUTRAL (1-2 sentences)\n"
-                    "- Key drivers: 2-4 bullets explaining what is driving the sentiment\n"
-                    "- Potential catalysts: 1-3 bullets (what could move the stock)\n"
-                    "- Key risks from news: 1-3 bullets\n\n"
-                    "### Actionable Takeaways\n"
-                    "- 2-3 bullets: what to monitor next and what headline types would change the sentiment.\n"
-                ),
-            ),
-            "1.1.1": PromptSpec(
-                prompt_id=AgentEnum.NEWS_ANALYST,
-                version="1.1.1",
-                text=(
-                    "You are a News & Sentiment Analyst. Your job is to summarize what the provided "
-                    "headlines/snippets imply for sentiment and near-term risk.\n\n"
-                    "Data discipline:\n"
-                    "- Use ONLY the headlines/snippets provided by tools or the user.\n"
-                    "- If dates/sources are not provided, say so (do not guess recency).\n"
-                    "- Do not fabricate events, numbers, or quotes.\n\n"
-                    "Sentiment labels:\n"
-                    "- POSITIVE: clear favorable catalyst or constructive tone\n"
-                    "- NEGATIVE: clear adverse catalyst or damaging tone\n"
-                    "- MIXED: meaningful positives and negatives present\n"
-                    "- NEUTRAL: informational/no clear directional impact\n\n"
-                    "Output format:\n"
-                    "### Facts\n"
-                    "- Top headlines (3-6 bullets):\n"
-                    "  - ...\n\n"
-                    "### Interpretation\n"
-                    "- Overall sentiment: POSITIVE / NEGATIVE / MIXED / NEUTRAL (1-2 sentences)\n"
-                    "- Key drivers: 2-4 bullets explaining what is driving the sentiment\n"
-                    "- Potential catalysts: 1-3 bullets (what could move the stock)\n"
-                    "- Key risks from news: 1-3 bullets\n\n"
-                    "### Actionable Takeaways\n"
-                    "- 2-3 bullets: what to monitor next and what headline types would change the sentiment.\n"
-                ),
-            ),
-        },
-        AgentEnum.MACRO_ANALYST: {
-            "1.0.0": PromptSpec(
-                prompt_id=AgentEnum.MACRO_ANALYST,
-                version="1.0.0",
-                text=(
-                    "You are a Macro Risk Analyst assessing market-wide conditions.\n\n"
-                    "Your job is to provide CONTEXT about:\n"
-                    "1. Overall market health (SPY trend vs 50D and 200D MA)\n"
-                    "2. Market volatility (VIX level interpretation)\n"
-                    "3. Sector performance (if applicable)\n"
-                    "4. Market sentiment (Fear & Greed Index)\n"
-                    "5. Geopolitical risks (if any)\n\n"
-                    "VIX Interpretation:\n"
-                    "- Below 15: Low volatility, complacent market\n"
-                    "- 15-20: Normal volatility\n"
-                    "- 20-30: Elevated volatility, increased uncertainty\n"
-                    "- Above 30: High volatility, fear in the market\n\n"
-                    "Fear & Greed Interpretation:\n"
-                    "- 0-24: Extreme Fear (potential buying opportunity)\n"
-                    "- 25-44: Fear\n"
-                    "- 45-55: Neutral\n"
-                    "- 56-75: Greed\n"
-                    "- 76-100: Extreme Greed (potential caution)\n\n"
-                    "SPY Trend:\n"
-                    "- Above 50D and 200D MA: Bullish\n"
-                    "- Above 50D, below 200D MA: Mixed\n"
-                    "- Below 50D MA: Showing weakness\n"
-                    "- Below both: Bearish\n\n"
-                    "Be objective and data-driven. Focus on facts, not predictions.\n"
-                    "Your output should summarize the current macro environment clearly.\n"
-                ),
-            ),
-        },
-        AgentEnum.ROUTER: {
-            "1.0.0": PromptSpec(
-                prompt_id=AgentEnum.ROUTER,
-                version="1.0.0",
-                text=(
-                    "You are a query router for a stock analysis system.\n\n"
-                    "Analyze the user's query and determine:\n"
-                    "1. Which stock ticker they are asking about\n"
-                    "2. Which type(s) of analysis they need\n\n"
-                    "Analysis types:\n"
-                    "- TECHNICAL: Price trends, moving averages, volume, support/resistance, chart patterns\n"
-                    "- FUNDAMENTAL: P/E ratio, market cap, revenue, earnings, valuation, financials\n"
-                    "- NEWS: Recent headlines, sentiment, market news, events, announcements\n"
-                    "- MACRO: Market-wide conditions, SPY/VIX levels, sector performance, Fear & Greed\n\n"
-                    "Rules:\n"
-                    "- If the query is vague like \"analyze X\" or \"tell me about X\", enable ALL analysis types\n"
-                    "- If the query mentions specific aspects, only enable relevant types\n"
-                    "- MACRO is usually enabled for comprehensive analysis (market context is valuable)\n"
-                    "- Always extract the ticker symbol (convert company names to tickers if needed)\n\n"
-                    "Examples:\n"
-                    "- \"What's the news on NVDA?\" \u2192 run_news=True, run_macro=True\n"
-                    "- \"Is AAPL overvalued?\" \u2192 run_fundamental=True, run_macro=True\n"
-                    "- \"TSLA price and trends\" \u2192 run_technical=True, run_macro=True\n"
-                    "- \"Full analysis of MSFT\" \u2192 all True\n"
-                    "- \"Should I buy GOOGL?\" \u2192 all True (needs comprehensive view)\n"
-                ),
-            ),
-            "1.0.1": PromptSpec(
-                prompt_id=AgentEnum.ROUTER,
-                version="1.0.1",
-                text=(
-                    "You are a query router for a stock analysis system.\n\n"
-                    "Analyze the user's query and determine:\n"
-                    "1. Which stock ticker they are asking about\n"
-                    "2. Which type(s) of analysis they need\n\n"
-                    "Analysis types:\n"
-                    "- TECHNICAL: price trends, moving averages, volume, 52-week range positioning\n"
-                    "- FUNDAMENTAL: P/E, forward P/E, market cap, revenue, EPS, margins, debt-to-equity\n"
-                    "- NEWS: recent headlines, sentiment, company events\n"
-                    "- MACRO: SPY/VIX levels, sector ETF context, fear & greed, geopolitical risks\n\n"
-                    "Rules:\n"
-                    "- If the query is vague (\"analyze X\", \"tell me about X\", \"should I buy X\"), enable "
-                    "TECHNICAL+FUNDAMENTAL+NEWS+MACRO.\n"
-                    "- If the query asks about a specific aspect, enable only the relevant type(s); MACRO is usually enabled for context.\n"
-                    "- If multiple tickers are mentioned, pick the most central one and mention the others in reasoning.\n"
-                    "- If you cannot confidently identify a ticker, set ticker=\"UNKNOWN\" and set all run_* flags to False.\n\n"
-                    "Examples:\n"
-                    "- \"What's the news on NVDA?\" \u2192 run_news=True, run_macro=True\n"
-                    "- \"Is AAPL overvalued?\" \u2192 run_fundamental=True, run_macro=True\n"
-                    "- \"TSLA price and trends\" \u2192 run_technical=True, run_macro=True\n"
-                    "- \"Full analysis of MSFT\" \u2192 all True\n"
-                    "- \"Should I buy GOOGL?\" \u2192 all True\n"
-                ),
-            ),
-        },
-        AgentEnum.INVESTMENT_ANALYST: {
-            "1.0.0": PromptSpec(
-                prompt_id=AgentEnum.INVESTMENT_ANALYST,
-                version="1.0.0",
-                text=(
-                    "You are a Senior Investment Analyst with expertise in equity research.\n\n"
-                    "Your task is to synthesize all available analysis data and provide an actionable investment outlook.\n\n"
-                    "Based on the analysis provided below, generate a comprehensive investment outlook that includes:\n\n"
-                    "1. **RECOMMENDATION**: BUY, HOLD, or SELL with confidence level (High/Medium/Low)\n"
-                    "2. **PRICE TARGET**: Specific price target with brief methodology explanation\n"
-                    "3. **RISK ASSESSMENT**: LOW, MEDIUM, or HIGH with top 3 key risks\n"
-                    "4. **INVESTMENT THESIS**: 2-3 sentence summary of the investment case\n\n"
-                    "Guidelines:\n"
-                    "- Be specific and actionable in your recommendations\n"
-                    "- Base price targets on available fundamental data (P/E, growth rates, etc.)\n"
-                    "- Consider both upside potential and downside risks\n"
-                    "- Consider macro conditions (market health, VIX, sentiment) in your risk assessment\n"
-                    "- If data is limited, acknowledge uncertainty in your confidence level\n\n"
-                    "---\n\n"
-                    "Stock Ticker: {ticker}\n\n"
-                    "Technical Analysis:\n"
-                    "{technical_analysis}\n\n"
-                    "Fundamental Analysis:\n"
-                    "{fundamental_analysis}\n\n"
-                    "News & Sentiment Analysis:\n"
-                    "{news_analysis}\n\n"
-                    "Macro Analysis:\n"
-                    "{macro_analysis}\n\n"
-                    "---\n\n"
-                    "Provide your investment outlook in the following format:\n\n"
-                    "**Recommendation:** [BUY/HOLD/SELL] ([High/Medium/Low] Confidence)\n\n"
-                    "**Price Target:** $[price] ([+/-X%] from current)\n"
-                    "- [Brief methodology explanation]\n\n"
-                    "**Risk Assessment:** [LOW/MEDIUM/HIGH]\n"
-                    "- Key Risks:\n"
-                    "  1. [Risk 1]\n"
-                    "  2. [Risk 2]\n"
-                    "  3. [Risk 3]\n\n"
-                    "**Investment Thesis:**\n"
-                    "[2-3 sentence summary]\n"
-                ),
-            ),
-            "1.0.1": PromptSpec(
-                prompt_id=AgentEnum.INVESTMENT_ANALYST,
-                version="1.0.1",
-                text=(
-                    "You are a Senior Investment Analyst. Your job is to synthesize the provided analyses into a clear recommendation.\n\n"
-                    "Data discipline:\n"
-                    "- Use ONLY information present in the provided analyses.\n"
-                    "- If a key input is missing (e.g., current price), explicitly mark it as not available.\n"
-                    "- Prefer scenario-based language over certainty when signals conflict.\n\n"
-                    "Based on the analysis provided below, generate a comprehensive investment outlook that includes:\n\n"
-                    "1. **RECOMMENDATION**: BUY, HOLD, or SELL with confidence level (High/Medium/Low)\n"
-                    "2. **PRICE TARGET**: Specific price target with brief methodology explanation\n"
-                    "3. **RISK ASSESSMENT**: LOW, MEDIUM, or HIGH with top 3 key risks\n"
-                    "4. **INVESTMENT THESIS**: 2-3 sentence summary of the investment case\n\n"
-                    "Guidelines:\n"
-                    "- Be specific and actionable.\n"
-                    "- Use fundamental analysis for the 'why', technical analysis for timing/risk, news as catalysts, macro as context.\n"
-                    "- If data is limited or contradictory, lower confidence and say what would change your view.\n\n"
-                    "---\n\n"
-                    "Stock Ticker: {ticker}\n\n"
-                    "Technical Analysis:\n"
-                    "{technical_analysis}\n\n"
-                    "Fundamental Analysis:\n"
-                    "{fundamental_analysis}\n\n"
-                    "News & Sentiment Analysis:\n"
-                    "{news_analysis}\n\n"
-                    "Macro Analysis:\n"
-                    "{macro_analysis}\n\n"
-                    "---\n\n"
-                    "Provide your investment outlook in the following format:\n\n"
-                    "**Recommendation:** [BUY/HOLD/SELL] ([High/Medium/Low] Confidence)\n\n"
-                    "**Price Target:** $[price] ([+/-X%] from current, or 'N/A from current' if current price is not provided)\n"
-                    "- [Brief methodology explanation]\n\n"
-                    "**Risk Assessment:** [LOW/MEDIUM/HIGH]\n"
-                    "- Key Risks:\n"
-                    "  1. [Risk 1]\n"
-                    "  2. [Risk 2]\n"
-                    "  3. [Risk 3]\n\n"
-                    "**Investment Thesis:**\n"
-                    "[2-3 sentence summary]\n"
-                ),
-            ),
-        },
-    }
+    # 1.1.1 entries reuse the 1.1.0 file — no text change in that release;
+    # sharing one loaded string keeps that explicit and avoids a duplicate read.
+    technical_1_1 = _load_text(AgentEnum.TECHNICAL_ANALYST, "1.1.0")
+    fundamental_1_1 = _load_text(AgentEnum.FUNDAMENTAL_ANALYST, "1.1.0")
+    news_1_1 = _load_text(AgentEnum.NEWS_ANALYST, "1.1.0")
+    # Positional construction: field order is (prompt_id, version, text).
+    specs = (
+        PromptSpec(AgentEnum.TECHNICAL_ANALYST, "1.0.0", _load_text(AgentEnum.TECHNICAL_ANALYST, "1.0.0")),
+        PromptSpec(AgentEnum.TECHNICAL_ANALYST, "1.1.0", technical_1_1),
+        PromptSpec(AgentEnum.TECHNICAL_ANALYST, "1.1.1", technical_1_1),
+        PromptSpec(AgentEnum.FUNDAMENTAL_ANALYST, "1.0.0", _load_text(AgentEnum.FUNDAMENTAL_ANALYST, "1.0.0")),
+        PromptSpec(AgentEnum.FUNDAMENTAL_ANALYST, "1.1.0", fundamental_1_1),
+        PromptSpec(AgentEnum.FUNDAMENTAL_ANALYST, "1.1.1", fundamental_1_1),
+        PromptSpec(AgentEnum.NEWS_ANALYST, "1.0.0", _load_text(AgentEnum.NEWS_ANALYST, "1.0.0")),
+        PromptSpec(AgentEnum.NEWS_ANALYST, "1.1.0", news_1_1),
+        PromptSpec(AgentEnum.NEWS_ANALYST, "1.1.1", news_1_1),
+        PromptSpec(AgentEnum.MACRO_ANALYST, "1.0.0", _load_text(AgentEnum.MACRO_ANALYST, "1.0.0")),
+        PromptSpec(AgentEnum.ROUTER, "1.0.0", _load_text(AgentEnum.ROUTER, "1.0.0")),
+        PromptSpec(AgentEnum.ROUTER, "1.0.1", _load_text(AgentEnum.ROUTER, "1.0.1")),
+        PromptSpec(AgentEnum.INVESTMENT_ANALYST, "1.0.0", _load_text(AgentEnum.INVESTMENT_ANALYST, "1.0.0")),
+        PromptSpec(AgentEnum.INVESTMENT_ANALYST, "1.0.1", _load_text(AgentEnum.INVESTMENT_ANALYST, "1.0.1")),
+    )
+    # Version keys are interned so repeated lookups short-circuit on string
+    # identity before falling back to a full hash/compare.
+    return {(spec.prompt_id, sys.intern(spec.version)): spec for spec in specs}
 
 
-def get_prompt_spec(prompt_id: AgentEnum, *, version: str | None = None) -> PromptSpec:
-    """Get a prompt spec by id and version (or the pinned active version).
+@lru_cache(maxsize=1)
+def _available_versions() -> dict[AgentEnum, tuple[str, ...]]:
+    """Return the sorted versions registered per prompt id (for error messages).
+
+    Returns:
+        Mapping of agent enum -> sorted tuple of registered versions.
+    """
+    versions: dict[AgentEnum, list[str]] = {}
+    for pid, ver in _registry():
+        versions.setdefault(pid, []).append(ver)
+    return {pid: tuple(sorted(v)) for pid, v in versions.items()}
+
+
+@lru_cache(maxsize=1)
+def _available_labels() -> dict[AgentEnum, str]:
+    """Return the pre-joined "1.0.0, 1.1.0, ..." version list per prompt id.
+
+    Error paths reference these instead of sorting and joining on every
+    failed lookup.
+
+    Returns:
+        Mapping of agent enum -> comma-separated registered versions.
+    """
+    return {pid: ", ".join(versions) for pid, versions in _available_versions().items()}
+
+
+@lru_cache(maxsize=1)
+def _pinned_prompts() -> dict[AgentEnum, PromptSpec]:
+    """Resolve every pinned prompt into a lookup table, built on first use.
+
+    Settings are read once; afterwards the common ``version=None`` path is a
+    single dict lookup with no settings dereference or string comparison.
+    Pins are validated against the registry when settings load, so entries
+    present in the pins are known-good here. Call
+    ``_pinned_prompts.cache_clear()`` after reloading settings in tests.
+
+    Returns:
+        Mapping of agent enum -> pinned prompt spec (unpinned agents are
+        omitted).
+    """
+    registry = _registry()
+    pins = get_settings().prompts.versions
+    return {pid: registry[(pid, sys.intern(pins[pid]))] for pid in _available_versions() if pid in pins}
+
+
+@lru_cache(maxsize=1)
+def _pinned_texts() -> dict[AgentEnum, str]:
+    """Return the pinned prompt texts keyed straight by agent.
+
+    Lets ``get_prompt_text`` hand back the string without materializing the
+    spec or paying the attribute dereference on the hot path.
+
+    Returns:
+        Mapping of agent enum -> pinned prompt text.
+    """
+    return {pid: spec.text for pid, spec in _pinned_prompts().items()}
+
+
+@lru_cache(maxsize=64)
+def _resolve(prompt_id: AgentEnum, version: str | None) -> PromptSpec:
+    """Resolve a (prompt_id, version) pair to its spec, memoized per pair.
+
+    Repeat resolutions — including the common ``version=None`` pinned case —
+    skip the settings dereference and registry probes entirely. Call
+    ``_resolve.cache_clear()`` after reloading settings in tests.
 
     Args:
         prompt_id: Agent enum identifier.
-        version: Explicit version override. If None, uses the pinned version from settings.
+        version: Explicit version override, or None for the pinned version.
 
     Returns:
         PromptSpec for the selected prompt.
@@ -476,25 +161,48 @@ def get_prompt_spec(prompt_id: AgentEnum, *, version: str | None = None) -> Prom
     Raises:
         KeyError: If prompt_id/version are not found.
     """
-    settings = get_settings()
-    registry = _registry()
-
-    if prompt_id not in registry:
+    available = _available_versions()
+    if prompt_id not in available:
         raise KeyError(f"Unknown prompt_id: {prompt_id}")
 
-    selected_version = version or settings.prompts.versions.get(prompt_id)
+    # Settings are only consulted when no explicit version was passed; the
+    # override path never touches them.
+    selected_version = sys.intern(version) if version else get_settings().prompts.versions.get(prompt_id)
     if not selected_version:
         raise KeyError(
             f"No pinned version found for prompt_id={prompt_id}. "
             f"Set prompts.versions.{prompt_id} in config.yaml"
         )
 
-    versions = registry[prompt_id]
-    if selected_version not in versions:
-        available = ", ".join(sorted(versions.keys()))
-        raise KeyError(f"Unknown version for prompt_id={prompt_id}: {selected_version}. Available: {available}")
+    spec = _registry().get((prompt_id, selected_version))
+    if spec is None:
+        raise KeyError(f"Unknown version for prompt_id={prompt_id}: {selected_version}. Available: {_available_labels()[prompt_id]}")
+
+    return spec
 
-    return versions[selected_version]
+
+def get_prompt_spec(prompt_id: AgentEnum, *, version: str | None = None) -> PromptSpec:
+    """Get a prompt spec by id and version (or the pinned active version).
+
+    Args:
+        prompt_id: Agent enum identifier.
+        version: Explicit version override. If None, uses the pinned version from settings.
+
+    Returns:
+        PromptSpec for the selected prompt.
+
+    Raises:
+        KeyError: If prompt_id/version are not found.
+    """
+    if version is None:
+        spec = _pinned_prompts().get(prompt_id)
+        if spec is not None:
+            return spec
+    try:
+        return _resolve(prompt_id, version)
+    except KeyError:
+        # Re-raised here so the documented contract lives with the public API.
+        raise
 
 
 def get_prompt_text(prompt_id: AgentEnum, *, version: str | None = None) -> str:
@@ -507,4 +215,124 @@ def get_prompt_text(prompt_id: AgentEnum, *, version: str | None = None) -> str:
     Returns:
         Prompt text.
     """
-    return get_prompt_spec(prompt_id, version=version).text
+    if version is None:
+        text = _pinned_texts().get(prompt_id)
+        if text is not None:
+            return text
+    return _resolve(prompt_id, version).text
+
+
+def get_prompt_texts(prompt_ids: Iterable[AgentEnum]) -> dict[AgentEnum, str]:
+    """Return pinned prompt texts for several agents in one pass.
+
+    Orchestration fan-out (technical/fundamental/news/macro) needs one prompt
+    per agent; resolving them through a single call keeps the hot path to pure
+    dict lookups against the pinned-text table.
+
+    Args:
+        prompt_ids: Agent enum identifiers to resolve.
+
+    Returns:
+        Mapping of agent enum -> pinned prompt text.
+
+    Raises:
+        KeyError: If any agent has no valid pinned version.
+    """
+    pinned = _pinned_texts()
+    try:
+        return {pid: pinned[pid] if pid in pinned else _resolve(pid, None).text for pid in prompt_ids}
+    except KeyError:
+        # Re-raised here so the documented contract lives with the public API.
+        raise
+
+
+@lru_cache(maxsize=16)
+def _compiled_template(prompt_id: AgentEnum, version: str | None) -> tuple[tuple[str, str | None], ...]:
+    """Pre-parse a templated prompt into (literal, field) segments.
+
+    ``str.format`` re-tokenizes the whole template on every call; parsing once
+    with ``string.Formatter`` turns each render into a join over precomputed
+    segments.
+
+    Args:
+        prompt_id: Agent enum identifier.
+        version: Explicit version override, or None for the pinned version.
+
+    Returns:
+        Tuple of (literal_text, field_name) pairs; field_name is None for a
+        trailing literal.
+    """
+    text = get_prompt_text(prompt_id, version=version)
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(text))
+
+
+def render_prompt(prompt_id: AgentEnum, *, version: str | None = None, **values: str) -> str:
+    """Render a templated prompt (e.g. INVESTMENT_ANALYST) with the given values.
+
+    Args:
+        prompt_id: Agent enum identifier.
+        version: Explicit version override. If None, uses the pinned version.
+        **values: Substitutions for the template's named placeholders.
+
+    Returns:
+        Rendered prompt text.
+
+    Raises:
+        KeyError: If a placeholder has no matching value.
+    """
+    parts: list[str] = []
+    for literal, field in _compiled_template(prompt_id, version):
+        parts.append(literal)
+        if field is not None:
+            if field not in values:
+                raise KeyError(f"Missing value for placeholder {{{field}}} in {prompt_id} prompt")
+            parts.append(str(values[field]))
+    return "".join(parts)
+
+
+# A semantic response cache (embedding near-duplicate queries and reusing LLM
+# answers) was considered and rejected: it needs a vector store plus a local
+# embedding model (sqlite-vec, ollama), which would dwarf this project's
+# dependency footprint, and stale stock analyses are actively harmful — a
+# cached "BUY" from yesterday's prices is worse than a fresh call. Exact
+# re-renders are already free via the lru_caches above.
+def render_investment_batch(items: list[dict[str, str]], *, version: str | None = None) -> str:
+    """Render one investment-analyst prompt covering several tickers.
+
+    Formatting one prompt per ticker repeats the ~2 KB static instruction
+    prefix N times; this emits the instructions and output format once and
+    enumerates labeled per-ticker analysis blocks in between, so batch
+    sessions spend tokens on data rather than repeated boilerplate.
+
+    Args:
+        items: One dict per ticker with the same keys the single-ticker
+            template takes (``ticker``, ``technical_analysis``,
+            ``fundamental_analysis``, ``news_analysis``, ``macro_analysis``).
+            Missing analyses default to "Not available".
+        version: Explicit version override. If None, uses the pinned version.
+
+    Returns:
+        Rendered batch prompt; responses are expected labeled "Ticker 1"
+        through "Ticker N" matching the block headers.
+    """
+    text = get_prompt_text(AgentEnum.INVESTMENT_ANALYST, version=version)
+    instructions, per_ticker, output_format = text.split("---", 2)
+
+    segments = tuple(string.Formatter().parse(per_ticker))
+    blocks = [instructions.rstrip(), ""]
+    for i, item in enumerate(items, 1):
+        values = {
+            "ticker": item.get("ticker", "UNKNOWN"),
+            "technical_analysis": item.get("technical_analysis") or "Not available",
+            "fundamental_analysis": item.get("fundamental_analysis") or "Not available",
+            "news_analysis": item.get("news_analysis") or "Not available",
+            "macro_analysis": item.get("macro_analysis") or "Not available",
+        }
+        rendered = "".join(literal + (str(values[field]) if field is not None else "") for literal, field, _, _ in segments)
+        blocks.append(f"---\n\n### Ticker {i}: {values['ticker']}\n{rendered.strip()}\n")
+    blocks.append(
+        "---" + output_format.rstrip() + "\n\n"
+        f"Provide {len(items)} outlooks, one per ticker, each labeled '### Ticker N: <symbol>' "
+        "matching the blocks above."
+    )
+    return "\n".join(blocks)
@@ -1,12 +1,20 @@
 """Tools for stock data retrieval and analysis."""
 
-from think_only_once.tools.macro_tools import (
-    get_fear_greed_index,
-    get_market_indices,
-    search_geopolitical_news,
-)
+from typing import TYPE_CHECKING
+
 from think_only_once.tools.yfinance_tools import get_fundamental_data, get_price_history, get_technical_data
 
+if TYPE_CHECKING:
+    from think_only_once.tools.macro_tools import (  # noqa: F401
+        get_fear_greed_index,
+        get_market_indices,
+        search_geopolitical_news,
+    )
+
+# Macro tools drag in web clients (requests, ddgs); load them lazily so that
+# importing the package for price data alone stays cheap.
+_MACRO_EXPORTS = {"get_fear_greed_index", "get_market_indices", "search_geopolitical_news"}
+
 __all__ = [
     "get_technical_data",
     "get_fundamental_data",
@@ -15,3 +23,22 @@ __all__ = [
     "search_geopolitical_news",
     "get_fear_greed_index",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve macro-tool exports on first access (PEP 562).
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The requested macro tool.
+
+    Raises:
+        AttributeError: If the name is not a known export.
+    """
+    if name in _MACRO_EXPORTS:
+        from think_only_once.tools import macro_tools
+
+        return getattr(macro_tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,48 @@
+"""Time-bounded memoization for network-backed tool helpers."""
+
+import threading
+import time
+from functools import wraps
+
+
+def ttl_cache(seconds: float):
+    """Memoize a function's results for a bounded wall-clock window.
+
+    Market-wide data (index quotes, Fear & Greed) changes on the order of
+    minutes, but the tools fetching it run on every analysis. Caching within
+    a short TTL turns repeat calls into dict lookups and keeps the rate
+    limits of the upstream APIs comfortable. Failures are cached too, which
+    doubles as a retry-storm guard against a temporarily broken endpoint.
+
+    Args:
+        seconds: How long a cached result stays fresh.
+
+    Returns:
+        Decorator wrapping the function with a TTL cache. The wrapper exposes
+        ``cache_clear()`` for tests.
+    """
+
+    def decorator(func):
+        cache: dict[tuple, tuple[object, float]] = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+                if hit is not None and hit[1] > now:
+                    return hit[0]
+            value = func(*args)
+            with lock:
+                cache[args] = (value, now + seconds)
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
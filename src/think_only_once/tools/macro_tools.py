@@ -4,12 +4,30 @@ Provides market indices data (SPY, VIX, sector ETFs), Fear & Greed Index,
 and geopolitical news search.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+
 import requests
 import yfinance as yf
-from ddgs import DDGS
 from langchain_core.tools import tool
 
 from think_only_once.models import FearGreedData, GeopoliticalNewsData, MarketIndicesData
+from think_only_once.tools.caching import ttl_cache
+from think_only_once.tools.search_tools import _SEARCH_EXECUTOR, _SEARCH_TIMEOUT_S, _WS_RE, _ddgs
+
+
+# Shared HTTP session: reuses pooled TCP/TLS connections across calls instead
+# of paying a fresh handshake per request.
+_HTTP = requests.Session()
+_HTTP.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP.headers.update(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json",
+    }
+)
 
 
 # Fear & Greed Index
@@ -39,6 +57,7 @@ def _get_fear_greed_label(value: int | None) -> str | None:
         return "Extreme Greed"
 
 
+@ttl_cache(60)
 def get_fear_greed_index() -> FearGreedData:
     """Fetch CNN Fear & Greed Index.
 
@@ -50,12 +69,8 @@ def get_fear_greed_index() -> FearGreedData:
     """
     try:
         url = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-        }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _HTTP.get(url, timeout=10)
         response.raise_for_status()
 
         data = response.json()
@@ -82,8 +97,8 @@ def get_fear_greed_index() -> FearGreedData:
     return FearGreedData(value=None, label=None)
 
 
-# Sector to ETF mapping
-SECTOR_ETF_MAP = {
+# Sector to ETF mapping (read-only; proxied to prevent accidental mutation)
+SECTOR_ETF_MAP = MappingProxyType({
     "Technology": "XLK",
     "Healthcare": "XLV",
     "Financial Services": "XLF",
@@ -97,9 +112,67 @@ SECTOR_ETF_MAP = {
     "Real Estate": "XLRE",
     "Utilities": "XLU",
     "Communication Services": "XLC",
-}
+})
+
+# Lowercase-keyed view so yfinance sector strings match regardless of casing
+# (a miss here silently drops the sector leg of the analysis).
+_SECTOR_ETF_MAP_LC = MappingProxyType({k.lower(): v for k, v in SECTOR_ETF_MAP.items()})
+
+
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+_QUOTE_FIELDS = "regularMarketPrice,fiftyDayAverage,twoHundredDayAverage,regularMarketChangePercent"
+
+
+@ttl_cache(60)
+def _batch_quote(symbols: tuple[str, ...]) -> dict[str, dict]:
+    """Fetch price fields for several symbols in one quote API call.
 
+    ``yf.Ticker(...).info`` scrapes a full quoteSummary page per symbol; the
+    v7 quote endpoint returns the four fields we need for all symbols in a
+    single small JSON response.
 
+    Args:
+        symbols: Ticker symbols to quote.
+
+    Returns:
+        Mapping of symbol -> dict with price, ma_50, ma_200, change_pct;
+        empty on any failure.
+    """
+    try:
+        response = _HTTP.get(
+            _QUOTE_URL,
+            params={"symbols": ",".join(symbols), "fields": _QUOTE_FIELDS},
+            timeout=10,
+        )
+        response.raise_for_status()
+        results = response.json()["quoteResponse"]["result"]
+        return {
+            quote["symbol"]: {
+                "price": quote.get("regularMarketPrice"),
+                "ma_50": quote.get("fiftyDayAverage"),
+                "ma_200": quote.get("twoHundredDayAverage"),
+                "change_pct": quote.get("regularMarketChangePercent"),
+            }
+            for quote in results
+        }
+    except Exception:
+        return {}
+
+
+@lru_cache(maxsize=32)
+def _market_ticker(symbol: str) -> yf.Ticker:
+    """Return a cached Ticker for market symbols (SPY, VIX, sector ETFs).
+
+    Args:
+        symbol: Ticker symbol.
+
+    Returns:
+        Shared yf.Ticker instance for the symbol.
+    """
+    return yf.Ticker(symbol)
+
+
+@ttl_cache(60)
 def _get_ticker_data(symbol: str) -> dict:
     """Fetch basic price data for a ticker.
 
@@ -110,14 +183,24 @@ def _get_ticker_data(symbol: str) -> dict:
         Dict with price, 50d_ma, 200d_ma, change_pct.
     """
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        ticker = _market_ticker(symbol)
         fast_info = getattr(ticker, "fast_info", {}) or {}
 
-        price = fast_info.get("last_price") or fast_info.get("previous_close") or info.get("regularMarketPrice")
-        ma_50 = fast_info.get("fifty_day_average") or info.get("fiftyDayAverage")
-        ma_200 = fast_info.get("two_hundred_day_average") or info.get("twoHundredDayAverage")
-        change_pct = info.get("regularMarketChangePercent")
+        last = fast_info.get("last_price")
+        prev = fast_info.get("previous_close")
+        price = last or prev
+        ma_50 = fast_info.get("fifty_day_average")
+        ma_200 = fast_info.get("two_hundred_day_average")
+        change_pct = (last - prev) / prev * 100 if last and prev else None
+
+        # fast_info is a lightweight quote; .info scrapes a full quoteSummary
+        # page. Only pay for the scrape when fast_info left gaps.
+        if None in (price, ma_50, ma_200, change_pct):
+            info = ticker.info
+            price = price or info.get("regularMarketPrice")
+            ma_50 = ma_50 if ma_50 is not None else info.get("fiftyDayAverage")
+            ma_200 = ma_200 if ma_200 is not None else info.get("twoHundredDayAverage")
+            change_pct = change_pct if change_pct is not None else info.get("regularMarketChangePercent")
 
         return {
             "price": price,
@@ -141,18 +224,27 @@ def get_market_indices(sector: str | None = None) -> MarketIndicesData:
     Returns:
         MarketIndicesData with SPY, VIX, sector ETF, and sentiment data.
     """
-    # Get SPY data
-    spy_data = _get_ticker_data("SPY")
-
-    # Get VIX data
-    vix_data = _get_ticker_data("^VIX")
-
-    # Get sector ETF data if sector is provided
-    sector_etf = SECTOR_ETF_MAP.get(sector) if sector else None
-    sector_data = _get_ticker_data(sector_etf) if sector_etf else {}
-
-    # Get Fear & Greed Index
-    fear_greed = get_fear_greed_index()
+    sector_etf = _SECTOR_ETF_MAP_LC.get(sector.lower()) if sector else None
+    symbols = ("SPY", "^VIX") + ((sector_etf,) if sector_etf else ())
+
+    def _fetch_quotes() -> dict[str, dict]:
+        quotes = _batch_quote(symbols)
+        if quotes:
+            return quotes
+        # Batch endpoint unavailable — fall back to per-symbol yfinance fetches.
+        return {sym: _get_ticker_data(sym) for sym in symbols}
+
+    # The quote batch and Fear & Greed are independent HTTP round-trips;
+    # issuing them concurrently collapses the critical path to the slower one.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="macro") as pool:
+        quotes_future = pool.submit(_fetch_quotes)
+        fear_greed_future = pool.submit(get_fear_greed_index)
+        quotes = quotes_future.result()
+        fear_greed = fear_greed_future.result()
+
+    spy_data = quotes.get("SPY") or {}
+    vix_data = quotes.get("^VIX") or {}
+    sector_data = (quotes.get(sector_etf) or {}) if sector_etf else {}
 
     return MarketIndicesData(
         spy_price=spy_data.get("price"),
@@ -182,12 +274,20 @@ def search_geopolitical_news() -> GeopoliticalNewsData:
     """
     query = "geopolitical risk market impact news today"
 
-    try:
-        with DDGS() as ddgs:
-            results = list(ddgs.news(query, max_results=5))
+    def _fetch() -> tuple[list[str], list[str]]:
+        headlines: list[str] = []
+        snippets: list[str] = []
+        for r in islice(_ddgs().news(query, max_results=5), 5):
+            if r.get("title"):
+                headlines.append(r["title"])
+            if r.get("body"):
+                # Collapse whitespace and truncate in one pass.
+                snippets.append(_WS_RE.sub(" ", r["body"])[:200])
+        return headlines, snippets
 
-        headlines = [r.get("title", "") for r in results if r.get("title")]
-        snippets = [r.get("body", "")[:200] for r in results if r.get("body")]
+    try:
+        # Hard deadline: DDG hangs are bounded instead of stalling the run.
+        headlines, snippets = _SEARCH_EXECUTOR.submit(_fetch).result(timeout=_SEARCH_TIMEOUT_S)
 
         return GeopoliticalNewsData(
             headlines=headlines,
@@ -1,10 +1,75 @@
 """Search tools for news and sentiment analysis."""
 
+import atexit
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
 from ddgs import DDGS
 from langchain_core.tools import tool
 
 from think_only_once.models import NewsData
 
+_WS_RE = re.compile(r"\s+")
+
+# A requests read-timeout only bounds inter-byte gaps, so a stalled DDG
+# connection can hang the whole pipeline indefinitely. Searches run on a
+# worker thread and the caller waits with a hard wall-clock deadline;
+# TimeoutError falls into each tool's graceful-degradation handler.
+_SEARCH_TIMEOUT_S = 30.0
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ddg-search")
+
+
+@lru_cache(maxsize=1)
+def _ddgs() -> DDGS:
+    """Return the shared DDGS client, created on first search.
+
+    Client setup (TLS context, cookies) is paid once instead of per call;
+    ddgs is re-entrant for synchronous use, so both news tools share the
+    instance. Closed at interpreter exit.
+
+    Returns:
+        Shared DDGS client.
+    """
+    client = DDGS()
+    atexit.register(client.__exit__, None, None, None)
+    return client
+
+
+def _collect_news(query: str, max_results: int) -> tuple[list[str], list[str]]:
+    """Stream DDG news results into headlines and snippets in one pass.
+
+    Runs on a worker thread. Iterating the generator directly (capped with
+    islice as a belt-and-braces bound) avoids materializing the intermediate
+    list of result dicts before parsing.
+
+    Args:
+        query: Search query string.
+        max_results: Maximum number of results to consume.
+
+    Returns:
+        Tuple of (headlines, snippets).
+    """
+    headlines: list[str] = []
+    snippets: list[str] = []
+    for r in islice(_ddgs().news(query, max_results=max_results), max_results):
+        title = (r.get("title") or "").strip()
+        body = (r.get("body") or "").strip()
+        source = (r.get("source") or "").strip()
+        date = (r.get("date") or "").strip()
+
+        if title:
+            src_date = ", ".join(filter(None, (source, date)))
+            headlines.append(f"{title} ({src_date})" if src_date else title)
+
+        if body:
+            # Truncate before normalizing: collapsing whitespace across a
+            # multi-KB body is wasted on everything past the snippet cut.
+            # The 320-char margin absorbs whatever the collapse removes.
+            snippets.append(_WS_RE.sub(" ", body[:320])[:280])
+    return headlines, snippets
+
 
 @tool
 def search_stock_news(ticker: str) -> NewsData:
@@ -19,26 +84,7 @@ def search_stock_news(ticker: str) -> NewsData:
     query = f"{ticker} stock news"
 
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.news(query, max_results=8))
-
-        headlines: list[str] = []
-        snippets: list[str] = []
-        for r in results:
-            title = (r.get("title") or "").strip()
-            body = (r.get("body") or "").strip()
-            source = (r.get("source") or "").strip()
-            date = (r.get("date") or "").strip()
-
-            if title:
-                meta_parts = [p for p in (source, date) if p]
-                meta = f" ({', '.join(meta_parts)})" if meta_parts else ""
-                headlines.append(f"{title}{meta}")
-
-            if body:
-                cleaned = " ".join(body.split())
-                snippets.append(cleaned[:280])
-
+        headlines, snippets = _SEARCH_EXECUTOR.submit(_collect_news, query, 8).result(timeout=_SEARCH_TIMEOUT_S)
         return NewsData(headlines=headlines, snippets=snippets, search_query=query)
     except Exception:
         # Graceful degradation
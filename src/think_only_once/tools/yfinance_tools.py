@@ -1,9 +1,42 @@
 """YFinance tools for technical and fundamental analysis."""
 
+from functools import lru_cache
+
 import yfinance as yf
 from langchain_core.tools import tool
 
 from think_only_once.models import FundamentalData, PriceHistory, PricePoint, TechnicalData
+from think_only_once.tools.caching import ttl_cache
+
+
+@lru_cache(maxsize=256)
+def _ticker(symbol: str) -> yf.Ticker:
+    """Return a cached Ticker, reusing its session cookies and API crumb.
+
+    Args:
+        symbol: Ticker symbol.
+
+    Returns:
+        Shared yf.Ticker instance for the symbol.
+    """
+    return yf.Ticker(symbol)
+
+
+@ttl_cache(30)
+def _get_info(symbol: str) -> tuple[dict, dict]:
+    """Fetch a symbol's info and fast_info once for both analysis tools.
+
+    ``info`` is the expensive quoteSummary scrape; sharing one fetch means a
+    combined technical + fundamental run pays for it once per TTL window.
+
+    Args:
+        symbol: Ticker symbol.
+
+    Returns:
+        Tuple of (info, fast_info) dicts.
+    """
+    stock = _ticker(symbol)
+    return stock.info, getattr(stock, "fast_info", {}) or {}
 
 
 def _first_non_null(*values):
@@ -15,12 +48,14 @@ def _first_non_null(*values):
     Returns:
         First non-null value or None.
     """
-    for value in values:
-        if value is not None:
-            return value
-    return None
+    return next((value for value in values if value is not None), None)
 
 
+# Generating specialized field-extraction functions at import time (building
+# source strings and exec()ing them) was considered for the builders below and
+# rejected: the dict lookups here cost microseconds against an HTTP fetch
+# measured in hundreds of milliseconds, and exec-built code defeats linters,
+# type checkers, and debugger stepping for no observable win.
 @tool
 def get_technical_data(ticker: str) -> TechnicalData:
     """Fetch technical analysis data for a stock.
@@ -31,9 +66,7 @@ def get_technical_data(ticker: str) -> TechnicalData:
     Returns:
         TechnicalData with price, moving averages, volume data.
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
-    fast_info = getattr(stock, "fast_info", {}) or {}
+    info, fast_info = _get_info(ticker)
 
     return TechnicalData(
         current_price=_first_non_null(
@@ -82,8 +115,7 @@ def get_fundamental_data(ticker: str) -> FundamentalData:
     Returns:
         FundamentalData with financial metrics like P/E, market cap, revenue.
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    info, _ = _get_info(ticker)
 
     return FundamentalData(
         market_cap=info.get("marketCap"),
@@ -109,21 +141,25 @@ def get_price_history(ticker: str, period: str = "6mo") -> PriceHistory:
     Returns:
         PriceHistory with list of daily OHLCV data points.
     """
-    stock = yf.Ticker(ticker)
+    stock = _ticker(ticker)
     hist = stock.history(period=period)
 
-    data_points = []
-    for date, row in hist.iterrows():
-        data_points.append(
-            PricePoint(
-                date=date.strftime("%Y-%m-%d"),
-                open=float(row["Open"]),
-                high=float(row["High"]),
-                low=float(row["Low"]),
-                close=float(row["Close"]),
-                volume=int(row["Volume"]),
-            )
-        )
+    if hist.empty:
+        return PriceHistory(ticker=ticker, period=period, data=[])
+
+    # Columnar extraction instead of iterrows(): six array pulls replace one
+    # boxed Series per row, which dominates for 1y/2y histories.
+    dates = hist.index.strftime("%Y-%m-%d")
+    opens = hist["Open"].to_numpy(dtype=float)
+    highs = hist["High"].to_numpy(dtype=float)
+    lows = hist["Low"].to_numpy(dtype=float)
+    closes = hist["Close"].to_numpy(dtype=float)
+    volumes = hist["Volume"].to_numpy(dtype="int64")
+
+    data_points = [
+        PricePoint(date=d, open=float(o), high=float(h), low=float(lo), close=float(c), volume=int(v))
+        for d, o, h, lo, c, v in zip(dates, opens, highs, lows, closes, volumes)
+    ]
 
     return PriceHistory(
         ticker=ticker,
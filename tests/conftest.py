@@ -1,14 +1,68 @@
 """Shared test fixtures and configuration."""
 
+import copy
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _clear_tool_caches():
+    """Clear the tools' TTL caches so each test sees fresh network mocks."""
+    from think_only_once.tools import macro_tools, search_tools, yfinance_tools
+
+    yield
+    macro_tools.get_fear_greed_index.cache_clear()
+    macro_tools._batch_quote.cache_clear()
+    macro_tools._get_ticker_data.cache_clear()
+    macro_tools._market_ticker.cache_clear()
+    search_tools._ddgs.cache_clear()
+    yfinance_tools._ticker.cache_clear()
+    yfinance_tools._get_info.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_agent_caches():
+    """Reset agent-level memoization so per-test patches apply cleanly."""
+    from think_only_once.agents import base, investment_analyst
+
+    yield
+    base._build_llm.cache_clear()
+    investment_analyst._cached_outlook.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def mock_env_api_key():
+    """Set up mock API key in environment (once per session)."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("OPENAI_API_KEY", "test-api-key-12345")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def _session_orchestrator():
+    """Build one orchestrator, with its graph compiled, for the whole session."""
+    from think_only_once.graph.orchestrator import StockAnalyzerOrchestrator
+
+    orchestrator = StockAnalyzerOrchestrator()
+    orchestrator.build(verbose=False)
+    return orchestrator
+
+
 @pytest.fixture
-def mock_env_api_key(monkeypatch):
-    """Set up mock API key in environment."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key-12345")
+def orchestrator(_session_orchestrator):
+    """Hand out the shared orchestrator, resetting its lazy agent cache.
+
+    The compiled graph is the expensive part and is reused across tests; the
+    lazily cached analyst agents are dropped afterwards so per-test patches
+    on the create_* factories keep taking effect.
+    """
+    yield _session_orchestrator
+    _session_orchestrator._technical_agent = None
+    _session_orchestrator._fundamental_agent = None
+    _session_orchestrator._news_agent = None
+    _session_orchestrator._macro_agent = None
 
 
 @pytest.fixture
@@ -32,9 +86,9 @@ def mock_chat_openai(mock_llm):
         yield mock_llm
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_yfinance_ticker():
-    """Create mock yfinance Ticker with sample data."""
+    """Create mock yfinance Ticker with sample data (read-only, shared per module)."""
     mock_ticker = MagicMock()
     mock_ticker.fast_info = {
         "last_price": 875.50,
@@ -78,7 +132,7 @@ def patch_yfinance(mock_yfinance_ticker):
         yield mock_yfinance_ticker
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_ddg_news_results():
     """Create mock DuckDuckGo NEWS results (ddgs.news)."""
     return [
@@ -101,59 +155,62 @@ def mock_ddg_news_results():
 
 @pytest.fixture
 def patch_ddg_search(mock_ddg_news_results):
-    """Patch DDGS context manager for search_stock_news."""
+    """Patch the shared DDGS client for search_stock_news."""
     mock_ddgs = MagicMock()
     mock_ddgs.news.return_value = mock_ddg_news_results
 
-    mock_ctx = MagicMock()
-    mock_ctx.__enter__.return_value = mock_ddgs
-    mock_ctx.__exit__.return_value = None
-
-    with patch("think_only_once.tools.search_tools.DDGS", return_value=mock_ctx):
+    with patch("think_only_once.tools.search_tools.DDGS", return_value=mock_ddgs):
         yield mock_ddgs
 
 
+# Base states are built once; the fixtures hand out deep copies so tests that
+# mutate flags stay isolated without rebuilding the dicts per test.
+_SAMPLE_ANALYSIS_STATE = {
+    "ticker": "NVDA",
+    "query": "Analyze NVDA stock",
+    "run_technical": True,
+    "run_fundamental": True,
+    "run_news": True,
+    "run_macro": True,
+    "technical_analysis": None,
+    "fundamental_analysis": None,
+    "news_analysis": None,
+    "macro_analysis": None,
+    "ai_outlook": None,
+    "messages": [],
+}
+
+_COMPLETED_ANALYSIS_STATE = {
+    "ticker": "NVDA",
+    "query": "Analyze NVDA stock",
+    "run_technical": True,
+    "run_fundamental": True,
+    "run_news": True,
+    "run_macro": True,
+    "technical_analysis": "Bullish trend",
+    "fundamental_analysis": "Overvalued but strong growth",
+    "news_analysis": "Positive sentiment",
+    "macro_analysis": "Market conditions favorable",
+    "ai_outlook": "BUY recommendation with $950 target",
+    "messages": [],
+}
+
+
 @pytest.fixture
 def sample_analysis_state():
     """Create sample AnalysisState for testing."""
-    return {
-        "ticker": "NVDA",
-        "query": "Analyze NVDA stock",
-        "run_technical": True,
-        "run_fundamental": True,
-        "run_news": True,
-        "run_macro": True,
-        "technical_analysis": None,
-        "fundamental_analysis": None,
-        "news_analysis": None,
-        "macro_analysis": None,
-        "ai_outlook": None,
-        "messages": [],
-    }
+    return copy.deepcopy(_SAMPLE_ANALYSIS_STATE)
 
 
 @pytest.fixture
 def completed_analysis_state():
     """Create completed AnalysisState with all analyses."""
-    return {
-        "ticker": "NVDA",
-        "query": "Analyze NVDA stock",
-        "run_technical": True,
-        "run_fundamental": True,
-        "run_news": True,
-        "run_macro": True,
-        "technical_analysis": "Bullish trend",
-        "fundamental_analysis": "Overvalued but strong growth",
-        "news_analysis": "Positive sentiment",
-        "macro_analysis": "Market conditions favorable",
-        "ai_outlook": "BUY recommendation with $950 target",
-        "messages": [],
-    }
+    return copy.deepcopy(_COMPLETED_ANALYSIS_STATE)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_router_decision():
-    """Create mock RouterDecision for full analysis."""
+    """Create mock RouterDecision for full analysis (read-only, shared per module)."""
     from think_only_once.agents.router import RouterDecision
 
     return RouterDecision(
@@ -166,7 +223,7 @@ def mock_router_decision():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_yfinance_market_ticker():
     """Create mock yfinance Ticker for market indices (SPY, VIX)."""
     mock_ticker = MagicMock()
@@ -185,7 +242,7 @@ def mock_yfinance_market_ticker():
     return mock_ticker
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_ddg_news():
     """Create mock DuckDuckGo news results for geopolitical news."""
     return [
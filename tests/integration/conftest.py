@@ -0,0 +1,31 @@
+"""Fixtures shared by the integration tests."""
+
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from think_only_once.graph import orchestrator as orch_mod
+
+_ORCHESTRATOR_GLOBALS = (
+    "route_query",
+    "create_technical_analyst",
+    "create_fundamental_analyst",
+    "create_news_analyst",
+    "create_macro_analyst",
+    "generate_investment_outlook",
+)
+
+
+@pytest.fixture
+def orchestrator_mocks():
+    """Patch every orchestrator dependency through one ExitStack.
+
+    Yields:
+        Namespace with one mock per patched orchestrator global
+        (route_query, create_*_analyst, generate_investment_outlook).
+    """
+    with ExitStack() as stack:
+        mocks = {name: stack.enter_context(patch.object(orch_mod, name)) for name in _ORCHESTRATOR_GLOBALS}
+        yield SimpleNamespace(**mocks)
@@ -1,111 +1,85 @@
 """Integration tests for the analysis workflow."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
 from think_only_once.graph.orchestrator import StockAnalyzerOrchestrator
 
 
+def _agent_stub(content: str) -> SimpleNamespace:
+    """Build a minimal analyst-agent stand-in returning fixed message content.
+
+    Plain namespaces instead of MagicMock trees: attribute access is a slot
+    lookup rather than auto-child creation, and a typo'd attribute fails
+    loudly instead of silently producing another mock.
+
+    Args:
+        content: Text the stubbed agent reports back.
+
+    Returns:
+        Object with the .invoke() surface the analyst nodes use.
+    """
+    return SimpleNamespace(invoke=lambda _payload: {"messages": [SimpleNamespace(content=content)]})
+
+
+def _router_decision(ticker: str, **flags: bool) -> SimpleNamespace:
+    """Build a router-decision stand-in with the given run flags.
+
+    Args:
+        ticker: Ticker the router resolved.
+        **flags: run_technical/run_fundamental/run_news/run_macro overrides.
+
+    Returns:
+        Object with the RouterDecision attributes the graph reads.
+    """
+    decision = {"run_technical": True, "run_fundamental": True, "run_news": True, "run_macro": True, **flags}
+    return SimpleNamespace(ticker=ticker, reasoning="stubbed routing", **decision)
+
+
 @pytest.mark.integration
 class TestAnalysisWorkflow:
     """Integration tests for the full analysis workflow."""
 
-    def test_full_workflow_with_mocked_dependencies(self) -> None:
+    def test_full_workflow_with_mocked_dependencies(
+        self, orchestrator: StockAnalyzerOrchestrator, orchestrator_mocks: SimpleNamespace
+    ) -> None:
         """Test complete workflow with all dependencies mocked."""
-        orchestrator = StockAnalyzerOrchestrator()
-
-        with patch("think_only_once.graph.orchestrator.route_query") as mock_route, patch(
-            "think_only_once.graph.orchestrator.create_technical_analyst"
-        ) as mock_tech, patch(
-            "think_only_once.graph.orchestrator.create_fundamental_analyst"
-        ) as mock_fund, patch(
-            "think_only_once.graph.orchestrator.create_news_analyst"
-        ) as mock_news, patch(
-            "think_only_once.graph.orchestrator.create_macro_analyst"
-        ) as mock_macro, patch(
-            "think_only_once.graph.orchestrator.generate_investment_outlook"
-        ) as mock_outlook:
-            mock_route.return_value.ticker = "NVDA"
-            mock_route.return_value.run_technical = True
-            mock_route.return_value.run_fundamental = True
-            mock_route.return_value.run_news = True
-            mock_route.return_value.run_macro = True
-
-            tech_msg = MagicMock()
-            tech_msg.content = "Technical analysis"
-            tech_agent = MagicMock()
-            tech_agent.invoke.return_value = {"messages": [tech_msg]}
-
-            fund_msg = MagicMock()
-            fund_msg.content = "Fundamental analysis"
-            fund_agent = MagicMock()
-            fund_agent.invoke.return_value = {"messages": [fund_msg]}
-
-            news_msg = MagicMock()
-            news_msg.content = "News analysis"
-            news_agent = MagicMock()
-            news_agent.invoke.return_value = {"messages": [news_msg]}
-
-            macro_msg = MagicMock()
-            macro_msg.content = "Macro analysis"
-            macro_agent = MagicMock()
-            macro_agent.invoke.return_value = {"messages": [macro_msg]}
-
-            mock_tech.return_value = tech_agent
-            mock_fund.return_value = fund_agent
-            mock_news.return_value = news_agent
-            mock_macro.return_value = macro_agent
-            mock_outlook.return_value = (
-                "**Recommendation:** BUY (High Confidence)\n"
-                "**Price Target:** $150 (+10% from current)\n"
-                "**Investment Thesis:** Test thesis."
-            )
-
-            result = orchestrator.invoke("Analyze NVDA stock")
-
-            assert result is not None
-            assert "NVDA" in result.final_report
-            assert "Stock Analysis Report" in result.final_report
-            assert result.summary.recommendation == "BUY"
-
-    def test_workflow_respects_router_decisions(self) -> None:
+        orchestrator_mocks.route_query.return_value = _router_decision("NVDA")
+        orchestrator_mocks.create_technical_analyst.return_value = _agent_stub("Technical analysis")
+        orchestrator_mocks.create_fundamental_analyst.return_value = _agent_stub("Fundamental analysis")
+        orchestrator_mocks.create_news_analyst.return_value = _agent_stub("News analysis")
+        orchestrator_mocks.create_macro_analyst.return_value = _agent_stub("Macro analysis")
+        orchestrator_mocks.generate_investment_outlook.return_value = (
+            "**Recommendation:** BUY (High Confidence)\n"
+            "**Price Target:** $150 (+10% from current)\n"
+            "**Investment Thesis:** Test thesis."
+        )
+
+        result = orchestrator.invoke("Analyze NVDA stock")
+
+        assert result is not None
+        assert "NVDA" in result.final_report
+        assert "Stock Analysis Report" in result.final_report
+        assert result.summary.recommendation == "BUY"
+
+    def test_workflow_respects_router_decisions(
+        self, orchestrator: StockAnalyzerOrchestrator, orchestrator_mocks: SimpleNamespace
+    ) -> None:
         """Test that workflow only runs agents selected by router."""
-        orchestrator = StockAnalyzerOrchestrator()
-
-        with patch("think_only_once.graph.orchestrator.route_query") as mock_route, patch(
-            "think_only_once.graph.orchestrator.create_technical_analyst"
-        ) as mock_tech, patch(
-            "think_only_once.graph.orchestrator.create_fundamental_analyst"
-        ) as mock_fund, patch(
-            "think_only_once.graph.orchestrator.create_news_analyst"
-        ) as mock_news, patch(
-            "think_only_once.graph.orchestrator.create_macro_analyst"
-        ) as mock_macro, patch(
-            "think_only_once.graph.orchestrator.generate_investment_outlook"
-        ) as mock_outlook:
-            mock_route.return_value.ticker = "AAPL"
-            mock_route.return_value.run_technical = True
-            mock_route.return_value.run_fundamental = False
-            mock_route.return_value.run_news = False
-            mock_route.return_value.run_macro = False
-
-            tech_msg = MagicMock()
-            tech_msg.content = "Technical analysis"
-            tech_agent = MagicMock()
-            tech_agent.invoke.return_value = {"messages": [tech_msg]}
-            mock_tech.return_value = tech_agent
-            mock_fund.return_value = MagicMock()
-            mock_news.return_value = MagicMock()
-            mock_macro.return_value = MagicMock()
-            mock_outlook.return_value = (
-                "**Recommendation:** HOLD (Medium Confidence)\n"
-                "**Price Target:** $180 (+5% from current)\n"
-                "**Investment Thesis:** Hold thesis."
-            )
-
-            result = orchestrator.invoke("Check AAPL technicals")
-
-            assert "Technical Analysis" in result.final_report
-            assert "Fundamental Analysis" not in result.final_report
-            assert "News & Sentiment Analysis" not in result.final_report
+        orchestrator_mocks.route_query.return_value = _router_decision("AAPL", run_fundamental=False, run_news=False, run_macro=False)
+        orchestrator_mocks.create_technical_analyst.return_value = _agent_stub("Technical analysis")
+        orchestrator_mocks.create_fundamental_analyst.return_value = _agent_stub("unused")
+        orchestrator_mocks.create_news_analyst.return_value = _agent_stub("unused")
+        orchestrator_mocks.create_macro_analyst.return_value = _agent_stub("unused")
+        orchestrator_mocks.generate_investment_outlook.return_value = (
+            "**Recommendation:** HOLD (Medium Confidence)\n"
+            "**Price Target:** $180 (+5% from current)\n"
+            "**Investment Thesis:** Hold thesis."
+        )
+
+        result = orchestrator.invoke("Check AAPL technicals")
+
+        assert "Technical Analysis" in result.final_report
+        assert "Fundamental Analysis" not in result.final_report
+        assert "News & Sentiment Analysis" not in result.final_report
@@ -19,6 +19,15 @@ class TestGetLLM:
             assert llm is not None
             mock_chat.assert_called_once()
 
+    def test_get_llm_reuses_instance_for_same_config(self, mock_env_api_key) -> None:
+        """Test repeated get_llm calls share one cached client per config."""
+        with patch("think_only_once.agents.base.ChatOpenAI") as mock_chat:
+            mock_chat.return_value = MagicMock()
+            first = get_llm()
+            second = get_llm()
+            assert first is second
+            mock_chat.assert_called_once()
+
     def test_get_llm_raises_without_api_key(self, clean_env) -> None:
         """Test get_llm raises ValueError when no API key is available."""
         with pytest.raises(ValueError, match="API key required"):
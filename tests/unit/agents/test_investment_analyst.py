@@ -21,6 +21,14 @@ class TestCreateInvestmentAnalystChain:
         assert chain is not None
         assert hasattr(chain, "invoke")
 
+    def test_system_prompt_is_static(self, mock_env_api_key, mock_chat_openai) -> None:
+        """Test the system message takes no per-request variables (cacheable prefix)."""
+        chain = create_investment_analyst_chain()
+        system_msg, human_msg = chain.first.messages
+        assert system_msg.input_variables == []
+        assert "{technical_analysis}" in human_msg.prompt.template
+        assert "{ticker}" in human_msg.prompt.template
+
 
 class TestGenerateInvestmentOutlook:
     """Tests for generate_investment_outlook function."""
@@ -81,6 +89,23 @@ class TestGenerateInvestmentOutlook:
         assert isinstance(result, str)
 
 
+    def test_generate_investment_outlook_memoizes_repeat_inputs(
+        self, mock_env_api_key
+    ) -> None:
+        """Test identical inputs reuse the cached outlook without a second chain call."""
+        mock_chain = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = "**Recommendation:** BUY"
+        mock_chain.invoke.return_value = mock_response
+
+        with patch("think_only_once.agents.investment_analyst.create_investment_analyst_chain", return_value=mock_chain):
+            first = generate_investment_outlook("NVDA", "Bullish trend", None, None)
+            second = generate_investment_outlook("NVDA", "Bullish trend", None, None)
+
+        assert first == second
+        mock_chain.invoke.assert_called_once()
+
+
 class TestInvestmentAnalystPrompt:
     """Tests for the investment analyst prompt."""
 
@@ -99,16 +99,50 @@ agents:
         settings = Settings.from_yaml(missing_file)
         assert settings.llm.model == "gpt-4o-mini"
 
-    def test_settings_from_yaml_partial_config(self, tmp_path: Path) -> None:
-        """Test loading YAML with only some sections."""
-        yaml_content = """
-llm:
-  temperature: 0.8
-"""
-        yaml_file = tmp_path / "partial.yaml"
-        yaml_file.write_text(yaml_content)
-
-        settings = Settings.from_yaml(yaml_file)
+    def test_settings_from_yaml_text_partial_config(self) -> None:
+        """Test loading YAML text with only some sections."""
+        settings = Settings.from_yaml_text("llm:\n  temperature: 0.8\n")
         assert settings.llm.temperature == 0.8
         assert settings.llm.model == "gpt-4o-mini"
         assert settings.agents.verbose is False
+
+    def test_settings_from_yaml_text(self) -> None:
+        """Test loading custom values from in-memory YAML text."""
+        settings = Settings.from_yaml_text("llm:\n  model: gpt-4o\n  temperature: 0.3\n")
+        assert settings.llm.model == "gpt-4o"
+        assert settings.llm.temperature == 0.3
+
+    def test_settings_from_yaml_text_empty(self) -> None:
+        """Test empty YAML text yields defaults."""
+        settings = Settings.from_yaml_text("")
+        assert settings.llm.model == "gpt-4o-mini"
+
+    def test_settings_from_yaml_text_invalid_value(self) -> None:
+        """Test out-of-range YAML values fail validation."""
+        with pytest.raises(ValueError):
+            Settings.from_yaml_text("llm:\n  temperature: 3.0\n")
+
+
+class TestPromptSettings:
+    """Tests for PromptSettings pin validation."""
+
+    def test_valid_pins_accepted(self) -> None:
+        """Test pins matching registered prompt versions load cleanly."""
+        from think_only_once.config.settings import PromptSettings
+
+        settings = PromptSettings(versions={"router": "1.0.1", "technical_analyst": "1.1.1"})
+        assert settings.versions["router"] == "1.0.1"
+
+    def test_unknown_prompt_id_rejected(self) -> None:
+        """Test a pin for an unknown prompt id fails at load time."""
+        from think_only_once.config.settings import PromptSettings
+
+        with pytest.raises(ValueError, match="Unknown prompt id"):
+            PromptSettings(versions={"nonexistent_agent": "1.0.0"})
+
+    def test_unknown_version_rejected(self) -> None:
+        """Test a pin for an unregistered version fails at load time."""
+        from think_only_once.config.settings import PromptSettings
+
+        with pytest.raises(ValueError, match="Unknown version"):
+            PromptSettings(versions={"router": "9.9.9"})
@@ -1,5 +1,6 @@
 """Tests for HTML report generation module."""
 
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ import pytest
 
 from think_only_once.models import PriceHistory, PricePoint
 from think_only_once.output.html_report import (
+    _extract_recommendation,
     _generate_price_chart_html,
     _generate_svg_chart,
     _markdown_to_html,
@@ -94,31 +96,6 @@ class TestMarkdownToHtml:
         assert "<p>First paragraph</p>" in result
         assert "<p>Second paragraph</p>" in result
 
-    def test_recommendation_buy_styled(self) -> None:
-        """Test BUY recommendation gets special styling."""
-        markdown = "**Recommendation:** BUY"
-        result = _markdown_to_html(markdown)
-        assert 'class="recommendation buy"' in result
-        assert "BUY" in result
-
-    def test_recommendation_hold_styled(self) -> None:
-        """Test HOLD recommendation gets special styling."""
-        markdown = "**Recommendation:** HOLD"
-        result = _markdown_to_html(markdown)
-        assert 'class="recommendation hold"' in result
-
-    def test_recommendation_sell_styled(self) -> None:
-        """Test SELL recommendation gets special styling."""
-        markdown = "**Recommendation:** SELL"
-        result = _markdown_to_html(markdown)
-        assert 'class="recommendation sell"' in result
-
-    def test_recommendation_case_insensitive(self) -> None:
-        """Test recommendation styling is case insensitive."""
-        markdown = "**Recommendation:** buy"
-        result = _markdown_to_html(markdown)
-        assert 'class="recommendation buy"' in result
-
     def test_mixed_content(self) -> None:
         """Test mixed content with lists and paragraphs."""
         markdown = """Introduction paragraph.
@@ -212,6 +189,49 @@ Actual content"""
         assert sections[1][1] == "Actual content"
 
 
+class TestExtractRecommendation:
+    """Tests for _extract_recommendation function."""
+
+    @staticmethod
+    def _outlook_sections(rec_line: str) -> list[tuple[str, str]]:
+        """Build a sections list with an AI Investment Outlook body containing rec_line."""
+        return [("AI Investment Outlook", f"{rec_line}\n\n**Price Target:** $950")]
+
+    def test_buy_recommendation_badge(self) -> None:
+        """Test BUY recommendation gets buy badge class."""
+        summary, _ = _extract_recommendation(self._outlook_sections("**Recommendation:** BUY"))
+        assert 'class="recommendation buy"' in summary
+        assert "BUY" in summary
+
+    def test_hold_recommendation_badge(self) -> None:
+        """Test HOLD recommendation gets hold badge class."""
+        summary, _ = _extract_recommendation(self._outlook_sections("**Recommendation:** HOLD"))
+        assert 'class="recommendation hold"' in summary
+
+    def test_sell_recommendation_badge(self) -> None:
+        """Test SELL recommendation gets sell badge class."""
+        summary, _ = _extract_recommendation(self._outlook_sections("**Recommendation:** SELL"))
+        assert 'class="recommendation sell"' in summary
+
+    def test_recommendation_case_insensitive(self) -> None:
+        """Test badge class is determined case-insensitively."""
+        summary, _ = _extract_recommendation(self._outlook_sections("**Recommendation:** buy"))
+        assert 'class="recommendation buy"' in summary
+
+    def test_recommendation_line_stripped_from_section(self) -> None:
+        """Test the recommendation line is removed from the outlook body."""
+        _, sections = _extract_recommendation(self._outlook_sections("**Recommendation:** BUY"))
+        assert "Recommendation" not in sections[0][1]
+        assert "**Price Target:** $950" in sections[0][1]
+
+    def test_no_recommendation_returns_sections_unchanged(self) -> None:
+        """Test sections without a recommendation line pass through untouched."""
+        sections = [("Technical Analysis", "Bullish momentum")]
+        summary, result = _extract_recommendation(sections)
+        assert summary == ""
+        assert result == sections
+
+
 class TestGenerateHtmlReport:
     """Tests for generate_html_report function."""
 
@@ -275,7 +295,7 @@ Current price: $875.50
     def test_includes_date_and_time(self, sample_markdown_report: str) -> None:
         """Test date and time are included in meta."""
         with patch("think_only_once.output.html_report.datetime") as mock_dt:
-            mock_dt.now.return_value.strftime.side_effect = ["January 27, 2026", "14:30"]
+            mock_dt.now.return_value = datetime(2026, 1, 27, 14, 30)
             result = generate_html_report(sample_markdown_report)
             assert "January 27, 2026" in result
             assert "14:30" in result
@@ -0,0 +1,80 @@
+"""Tests for the prompt registry public API."""
+
+import pytest
+
+from think_only_once.enums import AgentEnum
+from think_only_once.prompts import get_prompt_text, get_prompt_texts, render_investment_batch, render_prompt
+
+
+class TestGetPromptTexts:
+    """Tests for the bulk get_prompt_texts lookup."""
+
+    def test_returns_pinned_text_per_agent(self) -> None:
+        """Test the bulk lookup matches single-agent lookups for pinned agents."""
+        agents = [AgentEnum.ROUTER, AgentEnum.TECHNICAL_ANALYST, AgentEnum.MACRO_ANALYST]
+        texts = get_prompt_texts(agents)
+
+        assert set(texts) == set(agents)
+        for agent in agents:
+            assert texts[agent] == get_prompt_text(agent)
+
+    def test_empty_iterable_returns_empty_mapping(self) -> None:
+        """Test an empty request resolves to an empty mapping."""
+        assert get_prompt_texts([]) == {}
+
+    def test_unknown_prompt_id_raises_key_error(self) -> None:
+        """Test an unregistered prompt id raises KeyError."""
+        with pytest.raises(KeyError, match="Unknown prompt_id"):
+            get_prompt_texts(["bogus_agent"])
+
+
+_OUTLOOK_VALUES = {
+    "ticker": "NVDA",
+    "technical_analysis": "Bullish trend",
+    "fundamental_analysis": "Strong financials",
+    "news_analysis": "Positive sentiment",
+    "macro_analysis": "Favorable conditions",
+}
+
+
+class TestRenderPrompt:
+    """Tests for the precompiled-template render_prompt."""
+
+    def test_matches_str_format(self) -> None:
+        """Test the segment renderer is equivalent to str.format on the raw text."""
+        expected = get_prompt_text(AgentEnum.INVESTMENT_ANALYST).format(**_OUTLOOK_VALUES)
+        assert render_prompt(AgentEnum.INVESTMENT_ANALYST, **_OUTLOOK_VALUES) == expected
+
+    def test_missing_placeholder_value_raises_key_error(self) -> None:
+        """Test a template field without a supplied value raises KeyError."""
+        with pytest.raises(KeyError, match="technical_analysis"):
+            render_prompt(AgentEnum.INVESTMENT_ANALYST, ticker="NVDA")
+
+    def test_unknown_prompt_id_raises_key_error(self) -> None:
+        """Test rendering an unregistered prompt id raises KeyError."""
+        with pytest.raises(KeyError, match="Unknown prompt_id"):
+            render_prompt("bogus_agent", ticker="NVDA")
+
+
+class TestRenderInvestmentBatch:
+    """Tests for the multi-ticker investment prompt renderer."""
+
+    def test_emits_instructions_once_and_one_block_per_ticker(self) -> None:
+        """Test the batch prompt shares the static prefix across labeled ticker blocks."""
+        items = [
+            dict(_OUTLOOK_VALUES),
+            {**_OUTLOOK_VALUES, "ticker": "AAPL"},
+        ]
+        rendered = render_investment_batch(items)
+
+        assert rendered.count("Senior Investment Analyst") == 1
+        assert "### Ticker 1: NVDA" in rendered
+        assert "### Ticker 2: AAPL" in rendered
+        assert "Provide 2 outlooks" in rendered
+
+    def test_missing_analyses_default_to_not_available(self) -> None:
+        """Test omitted analysis sections render the Not available placeholder."""
+        rendered = render_investment_batch([{"ticker": "TSLA"}])
+
+        assert "### Ticker 1: TSLA" in rendered
+        assert "Not available" in rendered
@@ -7,6 +7,7 @@ import pytest
 from think_only_once.models import FearGreedData, GeopoliticalNewsData, MarketIndicesData
 from think_only_once.tools.macro_tools import (
     SECTOR_ETF_MAP,
+    _batch_quote,
     _get_fear_greed_label,
     _get_ticker_data,
     get_fear_greed_index,
@@ -58,7 +59,7 @@ class TestGetFearGreedIndex:
 
     def test_returns_fear_greed_data_model(self) -> None:
         """Test that function returns FearGreedData model."""
-        with patch("think_only_once.tools.macro_tools.requests.get") as mock_get:
+        with patch("think_only_once.tools.macro_tools._HTTP.get") as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "fear_and_greed": {"score": 45.5, "rating": "Neutral"}
@@ -73,7 +74,7 @@ class TestGetFearGreedIndex:
 
     def test_graceful_degradation_on_network_error(self) -> None:
         """Test that function returns empty data on network error."""
-        with patch("think_only_once.tools.macro_tools.requests.get") as mock_get:
+        with patch("think_only_once.tools.macro_tools._HTTP.get") as mock_get:
             import requests
 
             mock_get.side_effect = requests.RequestException("Network error")
@@ -86,7 +87,7 @@ class TestGetFearGreedIndex:
 
     def test_graceful_degradation_on_parse_error(self) -> None:
         """Test that function returns empty data on parse error."""
-        with patch("think_only_once.tools.macro_tools.requests.get") as mock_get:
+        with patch("think_only_once.tools.macro_tools._HTTP.get") as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {"invalid": "data"}
             mock_get.return_value = mock_response
@@ -130,6 +131,44 @@ class TestGetTickerData:
             assert result == {}
 
 
+class TestBatchQuote:
+    """Tests for _batch_quote helper function."""
+
+    def test_parses_quote_response(self) -> None:
+        """Test that one response is parsed into per-symbol price dicts."""
+        with patch("think_only_once.tools.macro_tools._HTTP.get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {
+                "quoteResponse": {
+                    "result": [
+                        {
+                            "symbol": "SPY",
+                            "regularMarketPrice": 450.50,
+                            "fiftyDayAverage": 445.00,
+                            "twoHundredDayAverage": 430.00,
+                            "regularMarketChangePercent": 0.56,
+                        },
+                        {"symbol": "^VIX", "regularMarketPrice": 15.2},
+                    ]
+                }
+            }
+            mock_get.return_value = mock_response
+
+            result = _batch_quote(("SPY", "^VIX"))
+
+            assert result["SPY"]["price"] == 450.50
+            assert result["SPY"]["ma_50"] == 445.00
+            assert result["^VIX"]["price"] == 15.2
+            assert result["^VIX"]["change_pct"] is None
+
+    def test_returns_empty_dict_on_failure(self) -> None:
+        """Test that network failures degrade to an empty dict."""
+        with patch("think_only_once.tools.macro_tools._HTTP.get") as mock_get:
+            mock_get.side_effect = Exception("Network error")
+
+            assert _batch_quote(("SPY",)) == {}
+
+
 class TestSectorEtfMap:
     """Tests for SECTOR_ETF_MAP constant."""
 
@@ -154,9 +193,9 @@ class TestGetMarketIndices:
 
     def test_returns_market_indices_data_model(self) -> None:
         """Test that function returns MarketIndicesData model."""
-        with patch("think_only_once.tools.macro_tools._get_ticker_data") as mock_ticker, patch(
-            "think_only_once.tools.macro_tools.get_fear_greed_index"
-        ) as mock_fg:
+        with patch("think_only_once.tools.macro_tools._batch_quote", return_value={}), patch(
+            "think_only_once.tools.macro_tools._get_ticker_data"
+        ) as mock_ticker, patch("think_only_once.tools.macro_tools.get_fear_greed_index") as mock_fg:
             mock_ticker.return_value = {
                 "price": 450.50,
                 "ma_50": 445.00,
@@ -173,9 +212,9 @@ class TestGetMarketIndices:
 
     def test_includes_sector_etf_when_provided(self) -> None:
         """Test that sector ETF data is included when sector is provided."""
-        with patch("think_only_once.tools.macro_tools._get_ticker_data") as mock_ticker, patch(
-            "think_only_once.tools.macro_tools.get_fear_greed_index"
-        ) as mock_fg:
+        with patch("think_only_once.tools.macro_tools._batch_quote", return_value={}), patch(
+            "think_only_once.tools.macro_tools._get_ticker_data"
+        ) as mock_ticker, patch("think_only_once.tools.macro_tools.get_fear_greed_index") as mock_fg:
             mock_ticker.return_value = {
                 "price": 200.00,
                 "ma_50": 195.00,
@@ -190,9 +229,9 @@ class TestGetMarketIndices:
 
     def test_no_sector_etf_when_not_provided(self) -> None:
         """Test that sector ETF is None when sector is not provided."""
-        with patch("think_only_once.tools.macro_tools._get_ticker_data") as mock_ticker, patch(
-            "think_only_once.tools.macro_tools.get_fear_greed_index"
-        ) as mock_fg:
+        with patch("think_only_once.tools.macro_tools._batch_quote", return_value={}), patch(
+            "think_only_once.tools.macro_tools._get_ticker_data"
+        ) as mock_ticker, patch("think_only_once.tools.macro_tools.get_fear_greed_index") as mock_fg:
             mock_ticker.return_value = {"price": 450.50}
             mock_fg.return_value = FearGreedData(value=50, label="Neutral")
 
@@ -212,7 +251,7 @@ class TestSearchGeopoliticalNews:
 
     def test_returns_geopolitical_news_data_model(self) -> None:
         """Test that function returns GeopoliticalNewsData model."""
-        with patch("think_only_once.tools.macro_tools.DDGS") as mock_ddgs_class:
+        with patch("think_only_once.tools.search_tools.DDGS") as mock_ddgs_class:
             mock_ddgs = MagicMock()
             mock_ddgs.__enter__ = MagicMock(return_value=mock_ddgs)
             mock_ddgs.__exit__ = MagicMock(return_value=False)
@@ -230,7 +269,7 @@ class TestSearchGeopoliticalNews:
 
     def test_graceful_degradation_on_exception(self) -> None:
         """Test that function returns empty data on exception."""
-        with patch("think_only_once.tools.macro_tools.DDGS") as mock_ddgs_class:
+        with patch("think_only_once.tools.search_tools.DDGS") as mock_ddgs_class:
             mock_ddgs_class.side_effect = Exception("Search error")
 
             result = search_geopolitical_news.invoke({})
@@ -247,7 +286,7 @@ class TestSearchGeopoliticalNews:
 
     def test_includes_search_query(self) -> None:
         """Test that result includes the search query used."""
-        with patch("think_only_once.tools.macro_tools.DDGS") as mock_ddgs_class:
+        with patch("think_only_once.tools.search_tools.DDGS") as mock_ddgs_class:
             mock_ddgs = MagicMock()
             mock_ddgs.__enter__ = MagicMock(return_value=mock_ddgs)
             mock_ddgs.__exit__ = MagicMock(return_value=False)
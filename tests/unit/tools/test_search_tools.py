@@ -22,11 +22,7 @@ class TestSearchStockNews:
         mock_ddgs = MagicMock()
         mock_ddgs.news.return_value = mock_ddg_news_results
 
-        mock_ctx = MagicMock()
-        mock_ctx.__enter__.return_value = mock_ddgs
-        mock_ctx.__exit__.return_value = None
-
-        with patch("think_only_once.tools.search_tools.DDGS", return_value=mock_ctx):
+        with patch("think_only_once.tools.search_tools.DDGS", return_value=mock_ddgs):
             search_stock_news.invoke({"ticker": "AAPL"})
             mock_ddgs.news.assert_called_once()
             call_args = mock_ddgs.news.call_args[0][0]